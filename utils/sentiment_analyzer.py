@@ -1,52 +1,236 @@
+import atexit
+import multiprocessing
+import os
 import re
 import logging
-from typing import Dict, Any, List, Tuple
-from textblob import TextBlob
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Tuple
 import numpy as np
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Enhanced sentiment keywords, stored as bytes for the ASCII-lowered text
+POS_KW = {
+    'strong': (b'excellent', b'outstanding', b'remarkable', b'exceptional', b'brilliant', b'magnificent'),
+    'moderate': (b'good', b'positive', b'great', b'wonderful', b'nice', b'pleased', b'happy'),
+    'mild': (b'okay', b'fine', b'decent', b'acceptable', b'satisfactory')
+}
+
+NEG_KW = {
+    'strong': (b'terrible', b'awful', b'horrible', b'devastating', b'catastrophic', b'disastrous'),
+    'moderate': (b'bad', b'negative', b'poor', b'disappointing', b'concerning', b'troubling'),
+    'mild': (b'mediocre', b'lacking', b'insufficient', b'questionable')
+}
+
+# News-specific sentiment indicators
+NEWS_INDICATORS = {
+    b'crisis': -0.8,
+    b'emergency': -0.7,
+    b'breakthrough': 0.8,
+    b'success': 0.7,
+    b'failure': -0.6,
+    b'victory': 0.6,
+    b'defeat': -0.5,
+    b'improvement': 0.5,
+    b'decline': -0.4,
+    b'growth': 0.4
+}
+
+# Emotional indicators
+EMOTIONAL_WORDS = (
+    b'amazing', b'terrible', b'incredible', b'awful', b'fantastic', b'horrible',
+    b'outstanding', b'devastating', b'brilliant', b'disastrous', b'wonderful',
+    b'catastrophic', b'excellent', b'tragic', b'marvelous', b'dreadful'
+)
+
+# Signed per-keyword weights: positive keywords add, negative keywords subtract
+_STRENGTH_WEIGHTS = {'strong': 0.8, 'moderate': 0.5, 'mild': 0.3}
+_FLAT_KW_WEIGHTS: Dict[bytes, float] = {
+    **{kw: _STRENGTH_WEIGHTS[strength] for strength, kws in POS_KW.items() for kw in kws},
+    **{kw: -_STRENGTH_WEIGHTS[strength] for strength, kws in NEG_KW.items() for kw in kws}
+}
+
+_EMO_RE = re.compile(rb'\b(?:' + b'|'.join(EMOTIONAL_WORDS) + rb')\b')
+
+# ASCII-only lowercase table so keyword scans stay on the bytes C path
+_LOWER_TBL = bytes.maketrans(bytes(range(0x41, 0x5B)), bytes(range(0x61, 0x7B)))
+
+# Combination weights, in analyzer order: textblob, vader, keywords, news_specific
+_COMBINE_WEIGHTS = np.array([0.3, 0.4, 0.2, 0.1], dtype=np.float32)
+
+# Single Hyperscan database over every keyword set, compiled on first use
+_HS_DB = None
+_HS_PATTERNS: List[Tuple[str, bytes]] = []
+
+def _get_keyword_database():
+    """Compile all keyword sets into one shared Hyperscan database"""
+    global _HS_DB, _HS_PATTERNS
+    if hyperscan is None or _HS_DB is not None:
+        return _HS_DB, _HS_PATTERNS
+    
+    try:
+        patterns = [(('keyword', keyword), re.escape(keyword)) for keyword in _FLAT_KW_WEIGHTS]
+        patterns += [(('news', indicator), re.escape(indicator)) for indicator in NEWS_INDICATORS]
+        patterns += [(('emotional', word), rb'\b' + re.escape(word) + rb'\b') for word in EMOTIONAL_WORDS]
+        
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[expression for _, expression in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=[hyperscan.HS_FLAG_CASELESS] * len(patterns)
+        )
+        
+        _HS_DB = db
+        _HS_PATTERNS = [key for key, _ in patterns]
+        
+    except Exception as e:
+        logging.error("Error building keyword database: %s", e)
+    
+    return _HS_DB, _HS_PATTERNS
+
+# Batches at least this large are analyzed across worker processes
+PARALLEL_TRENDS_THRESHOLD = 64
+
+_worker_analyzer = None
+
+# Worker pool shared by every analyzer, started on the first large batch
+_PROCESS_POOL = None
+
+# TextBlob and VADER are loaded on first use and shared across instances
+_TEXTBLOB_CLASS = None
+_VADER_MODULE = None
+_VADER_SINGLETON = None
+
+def _get_textblob_class():
+    """Import TextBlob on first use"""
+    global _TEXTBLOB_CLASS
+    if _TEXTBLOB_CLASS is None:
+        from textblob import TextBlob
+        _TEXTBLOB_CLASS = TextBlob
+    return _TEXTBLOB_CLASS
+
+def _get_vader_module():
+    """Import VADER on first use"""
+    global _VADER_MODULE
+    if _VADER_MODULE is None:
+        from vaderSentiment import vaderSentiment
+        _VADER_MODULE = vaderSentiment
+    return _VADER_MODULE
+
+def _get_vader_analyzer():
+    """Build the shared VADER analyzer on first use"""
+    global _VADER_SINGLETON
+    if _VADER_SINGLETON is None:
+        _VADER_SINGLETON = _get_vader_module().SentimentIntensityAnalyzer()
+    return _VADER_SINGLETON
+
+def _usable_cpus() -> int:
+    """CPUs this process may run on, honouring affinity masks and container CPU sets"""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Start the shared worker pool on first use"""
+    global _PROCESS_POOL
+    if _PROCESS_POOL is None:
+        # The app runs threaded, and forking a threaded process can deadlock on locks
+        # held by other threads, so workers come from a forkserver (spawn where absent)
+        start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+        _PROCESS_POOL = ProcessPoolExecutor(max_workers=_usable_cpus(),
+                                            mp_context=multiprocessing.get_context(start_method))
+        atexit.register(_PROCESS_POOL.shutdown)
+    return _PROCESS_POOL
+
+def _analyze_in_worker(text: str) -> Dict[str, Any]:
+    """Analyze one text with a per-process SentimentAnalyzer"""
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        _worker_analyzer = SentimentAnalyzer()
+    return _worker_analyzer.analyze_comprehensive_sentiment(text)
+
 class SentimentAnalyzer:
     def __init__(self):
-        self.vader_analyzer = SentimentIntensityAnalyzer()
+        self.vader_analyzer = _get_vader_analyzer()
         
-        # Enhanced sentiment keywords
-        self.positive_keywords = {
-            'strong': ['excellent', 'outstanding', 'remarkable', 'exceptional', 'brilliant', 'magnificent'],
-            'moderate': ['good', 'positive', 'great', 'wonderful', 'nice', 'pleased', 'happy'],
-            'mild': ['okay', 'fine', 'decent', 'acceptable', 'satisfactory']
-        }
+        # Keyword configuration is shared, module-level and built once per process
+        self.positive_keywords = POS_KW
+        self.negative_keywords = NEG_KW
+        self.news_sentiment_indicators = NEWS_INDICATORS
+        self.emotional_words = EMOTIONAL_WORDS
         
-        self.negative_keywords = {
-            'strong': ['terrible', 'awful', 'horrible', 'devastating', 'catastrophic', 'disastrous'],
-            'moderate': ['bad', 'negative', 'poor', 'disappointing', 'concerning', 'troubling'],
-            'mild': ['mediocre', 'lacking', 'insufficient', 'questionable']
-        }
+        # Hyperscan scratch space is not thread-safe, so each thread scans with its own
+        # clone of this prototype; the database is shared
+        self._hs_db, self._hs_patterns = _get_keyword_database()
+        self._hs_scratch = hyperscan.Scratch(self._hs_db) if self._hs_db is not None else None
+        self._hs_local = threading.local()
+    
+    def _thread_scratch(self):
+        """Hyperscan scratch space owned by the calling thread"""
+        scratch = getattr(self._hs_local, 'scratch', None)
+        if scratch is None:
+            scratch = self._hs_local.scratch = self._hs_scratch.clone()
+        return scratch
+    
+    def _scan_keywords(self, text_lower: bytes) -> Optional[Dict[Tuple[str, bytes], int]]:
+        """Count every keyword in one Hyperscan pass, or None to use the regex path"""
+        if self._hs_db is None:
+            return None
         
-        # News-specific sentiment indicators
-        self.news_sentiment_indicators = {
-            'crisis': -0.8,
-            'emergency': -0.7,
-            'breakthrough': 0.8,
-            'success': 0.7,
-            'failure': -0.6,
-            'victory': 0.6,
-            'defeat': -0.5,
-            'improvement': 0.5,
-            'decline': -0.4,
-            'growth': 0.4
-        }
+        counts = [0] * len(self._hs_patterns)
+        
+        def on_match(pattern_id, start, end, flags, context):
+            context[pattern_id] += 1
+        
+        self._hs_db.scan(text_lower, match_event_handler=on_match,
+                         context=counts, scratch=self._thread_scratch())
+        
+        return {self._hs_patterns[i]: count for i, count in enumerate(counts) if count}
     
     def analyze_comprehensive_sentiment(self, text: str) -> Dict[str, Any]:
         """Perform comprehensive sentiment analysis"""
+        # Headline fragments and empty snippets carry no usable sentiment
+        if not text or not text.strip() or len(text) < 8:
+            return {
+                'label': 'neutral',
+                'score': 0.0,
+                'confidence': 0.0,
+                'emotional_intensity': 0.0,
+                'subjectivity': 0.5
+            }
+        
         try:
+            # Shared text features, computed once for all analyzers; non-ASCII characters
+            # become '?' so they still separate words for the boundary-anchored patterns
+            text_lower = text.encode('ascii', 'replace').translate(_LOWER_TBL)
+            
+            # Tokenize once for VADER; its token list doubles as the word count
+            sentitext = self._build_sentitext(text)
+            word_count = max(1, len(sentitext.words_and_emoticons))
+            
+            keyword_counts = self._scan_keywords(text_lower)
+            
             # Multiple sentiment analysis approaches
             textblob_result = self._analyze_with_textblob(text)
-            vader_result = self._analyze_with_vader(text)
-            keyword_result = self._analyze_with_keywords(text)
-            news_result = self._analyze_news_sentiment(text)
+            vader_result = self._analyze_with_vader(sentitext)
+            keyword_result = self._analyze_with_keywords(text_lower, keyword_counts)
+            news_result = self._analyze_news_sentiment(text_lower, keyword_counts)
             
             # Combine results
-            combined_result = self._combine_sentiment_results([
+            scores = np.array([
+                textblob_result['score'],
+                vader_result['score'],
+                keyword_result['score'],
+                news_result['score']
+            ], dtype=np.float32)
+            combined_result = self._combine_sentiment_results(scores, [
                 textblob_result,
                 vader_result,
                 keyword_result,
@@ -55,13 +239,13 @@ class SentimentAnalyzer:
             
             # Add confidence and additional metrics
             combined_result['confidence'] = self._calculate_confidence(combined_result)
-            combined_result['emotional_intensity'] = self._calculate_emotional_intensity(text)
+            combined_result['emotional_intensity'] = self._calculate_emotional_intensity(text_lower, word_count, keyword_counts)
             combined_result['subjectivity'] = textblob_result.get('subjectivity', 0.5)
             
             return combined_result
             
-        except Exception as e:
-            logging.error(f"Error in comprehensive sentiment analysis: {str(e)}")
+        except Exception:
+            logging.error("Error in comprehensive sentiment analysis", exc_info=True)
             return {
                 'label': 'neutral',
                 'score': 0.0,
@@ -72,281 +256,273 @@ class SentimentAnalyzer:
     
     def _analyze_with_textblob(self, text: str) -> Dict[str, Any]:
         """Analyze sentiment using TextBlob"""
-        try:
-            blob = TextBlob(text)
-            polarity = blob.sentiment.polarity
-            subjectivity = blob.sentiment.subjectivity
-            
-            # Convert polarity to label
-            if polarity > 0.1:
-                label = 'positive'
-            elif polarity < -0.1:
-                label = 'negative'
-            else:
-                label = 'neutral'
-            
-            return {
-                'score': polarity,
-                'label': label,
-                'subjectivity': subjectivity,
-                'method': 'textblob'
-            }
-            
-        except Exception as e:
-            logging.error(f"Error with TextBlob analysis: {str(e)}")
-            return {'score': 0.0, 'label': 'neutral', 'subjectivity': 0.5, 'method': 'textblob'}
+        blob = _get_textblob_class()(text)
+        polarity = blob.sentiment.polarity
+        subjectivity = blob.sentiment.subjectivity
+        
+        # Convert polarity to label
+        if polarity > 0.1:
+            label = 'positive'
+        elif polarity < -0.1:
+            label = 'negative'
+        else:
+            label = 'neutral'
+        
+        return {
+            'score': polarity,
+            'label': label,
+            'subjectivity': subjectivity,
+            'method': 'textblob'
+        }
     
-    def _analyze_with_vader(self, text: str) -> Dict[str, Any]:
-        """Analyze sentiment using VADER"""
-        try:
-            scores = self.vader_analyzer.polarity_scores(text)
-            compound = scores['compound']
-            
-            # Convert compound score to label
-            if compound >= 0.05:
-                label = 'positive'
-            elif compound <= -0.05:
-                label = 'negative'
-            else:
-                label = 'neutral'
-            
-            return {
-                'score': compound,
-                'label': label,
-                'positive': scores['pos'],
-                'negative': scores['neg'],
-                'neutral': scores['neu'],
-                'method': 'vader'
-            }
-            
-        except Exception as e:
-            logging.error(f"Error with VADER analysis: {str(e)}")
-            return {'score': 0.0, 'label': 'neutral', 'method': 'vader'}
+    def _build_sentitext(self, text: str):
+        """Tokenize text the way VADER's polarity_scores does"""
+        # Emoji descriptions are only substituted when non-ASCII text is present
+        if not text.isascii():
+            emojis = self.vader_analyzer.emojis
+            text_no_emoji = []
+            prev_space = True
+            for char in text:
+                description = emojis.get(char)
+                if description is not None:
+                    if not prev_space:
+                        text_no_emoji.append(' ')
+                    text_no_emoji.append(description)
+                    prev_space = False
+                else:
+                    text_no_emoji.append(char)
+                    prev_space = char == ' '
+            text = ''.join(text_no_emoji)
+        
+        return _get_vader_module().SentiText(text.strip())
+    
+    def _analyze_with_vader(self, sentitext) -> Dict[str, Any]:
+        """Analyze sentiment using VADER on a pre-tokenized text"""
+        vader = self.vader_analyzer
+        booster_dict = _get_vader_module().BOOSTER_DICT
+        words_and_emoticons = sentitext.words_and_emoticons
+        last_index = len(words_and_emoticons) - 1
+        
+        # Mirrors SentimentIntensityAnalyzer.polarity_scores without re-tokenizing
+        sentiments = []
+        for i, item in enumerate(words_and_emoticons):
+            item_lower = item.lower()
+            if item_lower in booster_dict:
+                sentiments.append(0)
+                continue
+            if i < last_index and item_lower == "kind" and words_and_emoticons[i + 1].lower() == "of":
+                sentiments.append(0)
+                continue
+            sentiments = vader.sentiment_valence(0, sentitext, item, i, sentiments)
+        
+        sentiments = vader._but_check(words_and_emoticons, sentiments)
+        scores = vader.score_valence(sentiments, sentitext.text)
+        compound = scores['compound']
+        
+        # Convert compound score to label
+        if compound >= 0.05:
+            label = 'positive'
+        elif compound <= -0.05:
+            label = 'negative'
+        else:
+            label = 'neutral'
+        
+        return {
+            'score': compound,
+            'label': label,
+            'positive': scores['pos'],
+            'negative': scores['neg'],
+            'neutral': scores['neu'],
+            'method': 'vader'
+        }
     
-    def _analyze_with_keywords(self, text: str) -> Dict[str, Any]:
+    def _analyze_with_keywords(self, text_lower: bytes,
+                               keyword_counts: Optional[Dict[Tuple[str, bytes], int]] = None) -> Dict[str, Any]:
         """Analyze sentiment using keyword matching"""
-        try:
-            text_lower = text.lower()
-            
-            positive_score = 0.0
-            negative_score = 0.0
-            
-            # Check positive keywords
-            for strength, keywords in self.positive_keywords.items():
-                for keyword in keywords:
-                    count = text_lower.count(keyword)
-                    if count > 0:
-                        if strength == 'strong':
-                            positive_score += count * 0.8
-                        elif strength == 'moderate':
-                            positive_score += count * 0.5
-                        else:
-                            positive_score += count * 0.3
-            
-            # Check negative keywords
-            for strength, keywords in self.negative_keywords.items():
-                for keyword in keywords:
-                    count = text_lower.count(keyword)
-                    if count > 0:
-                        if strength == 'strong':
-                            negative_score += count * 0.8
-                        elif strength == 'moderate':
-                            negative_score += count * 0.5
-                        else:
-                            negative_score += count * 0.3
-            
-            # Calculate final score
-            net_score = positive_score - negative_score
-            
-            # Normalize score
-            if net_score > 0:
-                normalized_score = min(1.0, net_score / 5.0)
-                label = 'positive'
-            elif net_score < 0:
-                normalized_score = max(-1.0, net_score / 5.0)
-                label = 'negative'
+        positive_score = 0.0
+        negative_score = 0.0
+        
+        # Check positive and negative keywords
+        for keyword, weight in _FLAT_KW_WEIGHTS.items():
+            if keyword_counts is not None:
+                count = keyword_counts.get(('keyword', keyword), 0)
             else:
-                normalized_score = 0.0
-                label = 'neutral'
-            
-            return {
-                'score': normalized_score,
-                'label': label,
-                'positive_keywords': positive_score,
-                'negative_keywords': negative_score,
-                'method': 'keywords'
-            }
-            
-        except Exception as e:
-            logging.error(f"Error with keyword analysis: {str(e)}")
-            return {'score': 0.0, 'label': 'neutral', 'method': 'keywords'}
+                count = text_lower.count(keyword)
+            if count > 0:
+                if weight > 0:
+                    positive_score += count * weight
+                else:
+                    negative_score -= count * weight
+        
+        # Calculate final score
+        net_score = positive_score - negative_score
+        
+        # Normalize score
+        if net_score > 0:
+            normalized_score = min(1.0, net_score / 5.0)
+            label = 'positive'
+        elif net_score < 0:
+            normalized_score = max(-1.0, net_score / 5.0)
+            label = 'negative'
+        else:
+            normalized_score = 0.0
+            label = 'neutral'
+        
+        return {
+            'score': normalized_score,
+            'label': label,
+            'positive_keywords': positive_score,
+            'negative_keywords': negative_score,
+            'method': 'keywords'
+        }
     
-    def _analyze_news_sentiment(self, text: str) -> Dict[str, Any]:
+    def _analyze_news_sentiment(self, text_lower: bytes,
+                                keyword_counts: Optional[Dict[Tuple[str, bytes], int]] = None) -> Dict[str, Any]:
         """Analyze sentiment specific to news content"""
-        try:
-            text_lower = text.lower()
-            
-            total_score = 0.0
-            indicator_count = 0
-            
-            for indicator, score in self.news_sentiment_indicators.items():
-                if indicator in text_lower:
-                    total_score += score
-                    indicator_count += 1
+        total_score = 0.0
+        indicator_count = 0
+        
+        for indicator, score in self.news_sentiment_indicators.items():
+            if keyword_counts is not None:
+                found = ('news', indicator) in keyword_counts
+            else:
+                found = indicator in text_lower
+            if found:
+                total_score += score
+                indicator_count += 1
+        
+        if indicator_count > 0:
+            average_score = total_score / indicator_count
             
-            if indicator_count > 0:
-                average_score = total_score / indicator_count
-                
-                if average_score > 0.1:
-                    label = 'positive'
-                elif average_score < -0.1:
-                    label = 'negative'
-                else:
-                    label = 'neutral'
+            if average_score > 0.1:
+                label = 'positive'
+            elif average_score < -0.1:
+                label = 'negative'
             else:
-                average_score = 0.0
                 label = 'neutral'
-            
-            return {
-                'score': average_score,
-                'label': label,
-                'indicators_found': indicator_count,
-                'method': 'news_specific'
-            }
-            
-        except Exception as e:
-            logging.error(f"Error with news sentiment analysis: {str(e)}")
-            return {'score': 0.0, 'label': 'neutral', 'method': 'news_specific'}
+        else:
+            average_score = 0.0
+            label = 'neutral'
+        
+        return {
+            'score': average_score,
+            'label': label,
+            'indicators_found': indicator_count,
+            'method': 'news_specific'
+        }
     
-    def _combine_sentiment_results(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _combine_sentiment_results(self, scores: np.ndarray, results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Combine multiple sentiment analysis results"""
-        try:
-            # Weight different methods
-            weights = {
-                'textblob': 0.3,
-                'vader': 0.4,
-                'keywords': 0.2,
-                'news_specific': 0.1
-            }
-            
-            total_score = 0.0
-            total_weight = 0.0
-            
-            for result in results:
-                method = result.get('method', 'unknown')
-                score = result.get('score', 0.0)
-                weight = weights.get(method, 0.1)
-                
-                total_score += score * weight
-                total_weight += weight
-            
-            # Calculate weighted average
-            if total_weight > 0:
-                final_score = total_score / total_weight
-            else:
-                final_score = 0.0
-            
-            # Determine final label
-            if final_score > 0.1:
-                final_label = 'positive'
-            elif final_score < -0.1:
-                final_label = 'negative'
-            else:
-                final_label = 'neutral'
-            
-            return {
-                'score': final_score,
-                'label': final_label,
-                'individual_results': results,
-                'method': 'combined'
-            }
-            
-        except Exception as e:
-            logging.error(f"Error combining sentiment results: {str(e)}")
-            return {'score': 0.0, 'label': 'neutral', 'method': 'combined'}
+        # Weighted average; the weights already sum to 1
+        final_score = float(_COMBINE_WEIGHTS @ scores)
+        
+        # Determine final label
+        if final_score > 0.1:
+            final_label = 'positive'
+        elif final_score < -0.1:
+            final_label = 'negative'
+        else:
+            final_label = 'neutral'
+        
+        return {
+            'score': final_score,
+            'label': final_label,
+            'individual_results': results,
+            'method': 'combined'
+        }
     
     def _calculate_confidence(self, result: Dict[str, Any]) -> float:
         """Calculate confidence in sentiment analysis"""
-        try:
-            score = abs(result.get('score', 0.0))
-            
-            # Higher absolute score = higher confidence
-            confidence = min(1.0, score * 2.0)
-            
-            # Adjust based on consistency across methods
-            individual_results = result.get('individual_results', [])
-            if len(individual_results) > 1:
-                labels = [r.get('label', 'neutral') for r in individual_results]
-                label_consistency = labels.count(result['label']) / len(labels)
-                confidence *= label_consistency
-            
-            return confidence
-            
-        except Exception as e:
-            logging.error(f"Error calculating confidence: {str(e)}")
-            return 0.5
+        score = abs(result.get('score', 0.0))
+        
+        # Higher absolute score = higher confidence
+        confidence = score + score if score < 0.5 else 1.0
+        
+        # Adjust based on consistency across methods
+        individual_results = result.get('individual_results', [])
+        if len(individual_results) > 1:
+            label_counts = Counter(r.get('label', 'neutral') for r in individual_results)
+            confidence *= label_counts.get(result['label'], 0) / len(individual_results)
+        
+        return confidence
     
-    def _calculate_emotional_intensity(self, text: str) -> float:
+    def _calculate_emotional_intensity(self, text_lower: bytes, word_count: int,
+                                       keyword_counts: Optional[Dict[Tuple[str, bytes], int]] = None) -> float:
         """Calculate emotional intensity of text"""
-        try:
-            # Count emotional indicators
-            emotional_words = [
-                'amazing', 'terrible', 'incredible', 'awful', 'fantastic', 'horrible',
-                'outstanding', 'devastating', 'brilliant', 'disastrous', 'wonderful',
-                'catastrophic', 'excellent', 'tragic', 'marvelous', 'dreadful'
-            ]
-            
-            text_lower = text.lower()
-            emotion_count = 0
-            
-            for word in emotional_words:
-                emotion_count += text_lower.count(word)
-            
-            # Calculate intensity based on emotional word density
-            word_count = len(text.split())
-            if word_count > 0:
-                intensity = min(1.0, emotion_count / word_count * 10)
-            else:
-                intensity = 0.0
-            
-            return intensity
-            
-        except Exception as e:
-            logging.error(f"Error calculating emotional intensity: {str(e)}")
-            return 0.0
+        # Count emotional indicators
+        if keyword_counts is not None:
+            emotion_count = sum(keyword_counts.get(('emotional', word), 0) for word in self.emotional_words)
+        else:
+            emotion_count = len(_EMO_RE.findall(text_lower))
+        
+        # Calculate intensity based on emotional word density
+        if word_count > 0:
+            intensity = min(1.0, emotion_count / word_count * 10)
+        else:
+            intensity = 0.0
+        
+        return intensity
+    
+    def _analyze_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Analyze texts, fanning large batches out to worker processes"""
+        # A single CPU gains nothing from workers, only pickling overhead
+        workers = _usable_cpus()
+        if len(texts) >= PARALLEL_TRENDS_THRESHOLD and workers > 1:
+            try:
+                chunksize = max(1, len(texts) // (workers * 4))
+                return list(_get_process_pool().map(_analyze_in_worker, texts, chunksize=chunksize))
+                
+            except Exception as e:
+                # A broken pool is dropped so the next large batch starts a fresh one
+                global _PROCESS_POOL
+                _PROCESS_POOL = None
+                logging.error("Error in parallel sentiment analysis, falling back to serial: %s", e)
+        
+        return [self.analyze_comprehensive_sentiment(text) for text in texts]
     
     def analyze_sentiment_trends(self, texts: List[str]) -> Dict[str, Any]:
         """Analyze sentiment trends across multiple texts"""
         try:
-            results = []
-            
-            for text in texts:
-                result = self.analyze_comprehensive_sentiment(text)
-                results.append(result)
-            
-            if not results:
+            n = len(texts)
+            if n == 0:
                 return {}
             
-            # Calculate trends
-            scores = [r['score'] for r in results]
-            labels = [r['label'] for r in results]
+            # Preallocate scores so the stats below work on a single array; the stats
+            # go back out as Python floats so the result stays JSON serializable
+            scores = np.empty(n, dtype=np.float32)
+            labels = []
+            
+            for i, result in enumerate(self._analyze_batch(texts)):
+                scores[i] = result['score']
+                labels.append(result['label'])
+            
+            # Linear trend via closed-form least-squares slope
+            ym = scores.mean()
+            if n > 1:
+                x = np.arange(n, dtype=np.float32)
+                xm = x.mean()
+                score_trend = ((x - xm) * (scores - ym)).sum() / ((x - xm) ** 2).sum()
+            else:
+                score_trend = 0.0
+            
+            label_counts = Counter(labels)
             
             trends = {
-                'average_score': np.mean(scores),
-                'score_trend': np.polyfit(range(len(scores)), scores, 1)[0],  # Linear trend
+                'average_score': float(ym),
+                'score_trend': float(score_trend),
                 'sentiment_distribution': {
-                    'positive': labels.count('positive'),
-                    'negative': labels.count('negative'),
-                    'neutral': labels.count('neutral')
+                    'positive': label_counts['positive'],
+                    'negative': label_counts['negative'],
+                    'neutral': label_counts['neutral']
                 },
-                'volatility': np.std(scores),
-                'total_articles': len(texts)
+                'volatility': float(scores.std()),
+                'total_articles': n
             }
             
             return trends
             
-        except Exception as e:
-            logging.error(f"Error analyzing sentiment trends: {str(e)}")
+        except Exception:
+            logging.error("Error analyzing sentiment trends", exc_info=True)
             return {}
     
     def get_sentiment_recommendations(self, sentiment_data: Dict[str, Any]) -> List[str]:
@@ -382,10 +558,11 @@ class SentimentAnalyzer:
             return recommendations
             
         except Exception as e:
-            logging.error(f"Error getting sentiment recommendations: {str(e)}")
+            logging.error("Error getting sentiment recommendations: %s", e)
             return []
     
-    def export_sentiment_analysis(self, text: str, detailed: bool = False) -> Dict[str, Any]:
+    def export_sentiment_analysis(self, text: str, detailed: bool = False,
+                                  now_iso: Optional[str] = None) -> Dict[str, Any]:
         """Export detailed sentiment analysis for external use"""
         try:
             result = self.analyze_comprehensive_sentiment(text)
@@ -396,7 +573,7 @@ class SentimentAnalyzer:
                 'sentiment_label': result['label'],
                 'confidence': result['confidence'],
                 'emotional_intensity': result['emotional_intensity'],
-                'analysis_timestamp': logging.datetime.now().isoformat()
+                'analysis_timestamp': now_iso or datetime.now(timezone.utc).isoformat()
             }
             
             if detailed:
@@ -409,5 +586,5 @@ class SentimentAnalyzer:
             return export_data
             
         except Exception as e:
-            logging.error(f"Error exporting sentiment analysis: {str(e)}")
+            logging.error("Error exporting sentiment analysis: %s", e)
             return {}
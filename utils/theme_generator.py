@@ -1,121 +1,315 @@
+import functools
 import json
 import logging
-from typing import Dict, Any, List, Optional
+import re
+from collections import ChainMap
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 from datetime import datetime
-import colorsys
 import random
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Ordered (field, value, keywords) rules for prompt parsing; earlier rules win per field.
+# Keywords match whole prompt words, or two adjacent words for phrases.
+PROMPT_KEYWORD_RULES = (
+    # Mood detection
+    ('mood', 'calm', frozenset({'calm', 'peaceful', 'serene', 'quiet'})),
+    ('mood', 'energetic', frozenset({'energetic', 'vibrant', 'bold', 'dynamic'})),
+    ('mood', 'warm', frozenset({'warm', 'cozy', 'welcoming', 'friendly'})),
+    ('mood', 'cool', frozenset({'cool', 'fresh', 'clean', 'minimal'})),
+    
+    # Style detection
+    ('style', 'professional', frozenset({'professional', 'business', 'corporate'})),
+    ('style', 'modern', frozenset({'modern', 'contemporary', 'sleek'})),
+    ('style', 'classic', frozenset({'classic', 'traditional', 'timeless'})),
+    ('style', 'tech', frozenset({'tech', 'digital', 'futuristic'})),
+    
+    # Energy level
+    ('energy', 'high', frozenset({'high', 'intense', 'strong', 'powerful'})),
+    ('energy', 'low', frozenset({'low', 'subtle', 'gentle', 'soft'})),
+    
+    # Formality level
+    ('formality', 'high', frozenset({'formal', 'serious', 'official'})),
+    ('formality', 'low', frozenset({'casual', 'informal', 'relaxed'})),
+    
+    # Contrast level
+    ('contrast', 'high', frozenset({'high contrast', 'bold', 'stark'})),
+    ('contrast', 'low', frozenset({'low contrast', 'subtle', 'muted'})),
+)
+
+# Characteristic -> base theme, typography and spacing selections
+_MOOD_TO_BASE = {'calm': 'calm', 'energetic': 'vibrant', 'warm': 'warm', 'cool': 'cool'}
+_STYLE_TO_BASE = {'professional': 'professional'}
+_STYLE_TO_FONTS = {'tech': 'tech', 'classic': 'classic'}
+_FORMALITY_TO_FONTS = {'high': 'classic', 'low': 'modern'}
+_ENERGY_TO_SPACING = {'high': 'generous', 'low': 'compact'}
+
+# Static :root and body section of generated theme CSS
+_CSS_ROOT_TEMPLATE = """
+            /* {name} */
+            /* Generated on {created_at} */
+            
+            :root {{
+                /* Colors */
+                --primary: {primary};
+                --secondary: {secondary};
+                --accent: {accent};
+                --background: {background};
+                --surface: {surface};
+                --text: {text};
+                --text-secondary: {text_secondary};
+                --border: {border};
+                --success: {success};
+                --warning: {warning};
+                --error: {error};
+                --info: {info};
+                
+                /* Typography */
+                --font-primary: {font_primary};
+                --font-secondary: {font_secondary};
+                --font-accent: {font_accent};
+                
+                /* Spacing */
+                --spacing-base: {spacing_base};
+                --spacing-scale: {spacing_scale};
+            }}
+            
+            /* Global Styles */
+            body {{
+                font-family: var(--font-primary);
+                color: var(--text);
+                background-color: var(--background);
+                line-height: 1.6;
+            }}
+            
+            /* Component Styles */
+            """
+
+# Fallback values for the :root template fields
+_CSS_DEFAULTS = {
+    'primary': '#1A73E8',
+    'secondary': '#34A853',
+    'accent': '#EA4335',
+    'background': '#F8F9FA',
+    'surface': '#FFFFFF',
+    'text': '#202124',
+    'text_secondary': '#5F6368',
+    'border': '#DADCE0',
+    'success': '#34A853',
+    'warning': '#FBBC04',
+    'error': '#EA4335',
+    'info': '#1A73E8',
+    'font_primary': 'Inter, sans-serif',
+    'font_secondary': 'Roboto, sans-serif',
+    'font_accent': 'Poppins, sans-serif',
+    'spacing_scale': '1.5'
+}
+
+# Theme style keys use underscores where CSS properties use hyphens
+_CSS_PROPERTY_TABLE = str.maketrans({'_': '-'})
+
+@functools.lru_cache(maxsize=64)
+def _px(pixels: int) -> str:
+    """Format an integer pixel value for CSS"""
+    return f"{pixels}px"
+
+def _freeze(value: Any) -> Any:
+    """Recursively wrap dicts in read-only mapping views"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+def _fresh_copy(value: Any) -> Any:
+    """Recursively copy mappings into new plain dicts"""
+    if isinstance(value, Mapping):
+        return {key: _fresh_copy(item) for key, item in value.items()}
+    return value
+
+def _hsl_batch_to_hex(hsl: np.ndarray) -> List[str]:
+    """Convert an (n, 3) array of (hue degrees, saturation, lightness) rows to hex colors"""
+    h = hsl[:, 0] / 360
+    s = hsl[:, 1]
+    l = hsl[:, 2]
+    
+    # Same arithmetic as colorsys.hls_to_rgb, applied to every row at once
+    m2 = np.where(l <= 0.5, l * (1.0 + s), l + s - (l * s))
+    m1 = 2.0 * l - m2
+    
+    def channel(hue: np.ndarray) -> np.ndarray:
+        hue = hue % 1.0
+        return np.select(
+            [hue < 1.0 / 6.0, hue < 0.5, hue < 2.0 / 3.0],
+            [m1 + (m2 - m1) * hue * 6.0, m2, m1 + (m2 - m1) * (2.0 / 3.0 - hue) * 6.0],
+            default=m1
+        )
+    
+    rgb = np.stack([channel(h + 1.0 / 3.0), channel(h), channel(h - 1.0 / 3.0)], axis=1)
+    rgb[s == 0.0] = l[s == 0.0, None]
+    rgb = (np.clip(rgb, 0.0, 1.0) * 255).astype(np.uint8)
+    
+    return [f"#{r:02X}{g:02X}{b:02X}" for r, g, b in rgb.tolist()]
 
 class ThemeGenerator:
-    def __init__(self):
-        # Base theme templates
-        self.base_themes = {
-            'modern': {
-                'primary_hue': 220,
-                'secondary_hue': 200,
-                'saturation': 0.7,
-                'lightness': 0.5,
-                'style': 'clean, minimalist, professional'
-            },
-            'vibrant': {
-                'primary_hue': 340,
-                'secondary_hue': 280,
-                'saturation': 0.9,
-                'lightness': 0.6,
-                'style': 'energetic, bold, attention-grabbing'
-            },
-            'calm': {
-                'primary_hue': 200,
-                'secondary_hue': 160,
-                'saturation': 0.4,
-                'lightness': 0.7,
-                'style': 'peaceful, serene, easy on eyes'
-            },
-            'professional': {
-                'primary_hue': 210,
-                'secondary_hue': 30,
-                'saturation': 0.6,
-                'lightness': 0.4,
-                'style': 'business-like, trustworthy, sophisticated'
-            },
-            'warm': {
-                'primary_hue': 30,
-                'secondary_hue': 60,
-                'saturation': 0.8,
-                'lightness': 0.6,
-                'style': 'welcoming, cozy, inviting'
-            },
-            'cool': {
-                'primary_hue': 180,
-                'secondary_hue': 240,
-                'saturation': 0.6,
-                'lightness': 0.5,
-                'style': 'fresh, modern, tech-oriented'
-            }
+    # Theme name parts by mood and style
+    _ADJECTIVES = {
+        'calm': ('Serene', 'Peaceful', 'Tranquil'),
+        'energetic': ('Dynamic', 'Vibrant', 'Bold'),
+        'warm': ('Cozy', 'Welcoming', 'Friendly'),
+        'cool': ('Fresh', 'Clean', 'Crisp'),
+        'neutral': ('Balanced', 'Classic', 'Timeless')
+    }
+    
+    _NOUNS = {
+        'modern': ('Edge', 'Flow', 'Pulse'),
+        'professional': ('Suite', 'Pro', 'Executive'),
+        'classic': ('Heritage', 'Vintage', 'Tradition'),
+        'tech': ('Code', 'Digital', 'Matrix')
+    }
+    
+    # Color detection keywords, plus a reverse index and keyword set built once
+    _COLOR_KEYWORDS = {
+        'blue': ('blue', 'navy', 'azure', 'cyan'),
+        'green': ('green', 'emerald', 'forest', 'mint'),
+        'red': ('red', 'crimson', 'ruby', 'coral'),
+        'purple': ('purple', 'violet', 'lavender', 'magenta'),
+        'orange': ('orange', 'amber', 'peach', 'tangerine'),
+        'yellow': ('yellow', 'gold', 'sunshine', 'lemon'),
+        'pink': ('pink', 'rose', 'blush', 'salmon'),
+        'brown': ('brown', 'tan', 'beige', 'chocolate')
+    }
+    _COLOR_REVERSE = {keyword: color for color, keywords in _COLOR_KEYWORDS.items() for keyword in keywords}
+    _COLOR_KEYWORD_SET = frozenset(_COLOR_REVERSE)
+    
+    # Base theme templates
+    base_themes = _freeze({
+        'modern': {
+            'primary_hue': 220,
+            'secondary_hue': 200,
+            'saturation': 0.7,
+            'lightness': 0.5,
+            'style': 'clean, minimalist, professional'
+        },
+        'vibrant': {
+            'primary_hue': 340,
+            'secondary_hue': 280,
+            'saturation': 0.9,
+            'lightness': 0.6,
+            'style': 'energetic, bold, attention-grabbing'
+        },
+        'calm': {
+            'primary_hue': 200,
+            'secondary_hue': 160,
+            'saturation': 0.4,
+            'lightness': 0.7,
+            'style': 'peaceful, serene, easy on eyes'
+        },
+        'professional': {
+            'primary_hue': 210,
+            'secondary_hue': 30,
+            'saturation': 0.6,
+            'lightness': 0.4,
+            'style': 'business-like, trustworthy, sophisticated'
+        },
+        'warm': {
+            'primary_hue': 30,
+            'secondary_hue': 60,
+            'saturation': 0.8,
+            'lightness': 0.6,
+            'style': 'welcoming, cozy, inviting'
+        },
+        'cool': {
+            'primary_hue': 180,
+            'secondary_hue': 240,
+            'saturation': 0.6,
+            'lightness': 0.5,
+            'style': 'fresh, modern, tech-oriented'
         }
-        
-        # Typography options
-        self.font_combinations = {
-            'modern': {
-                'primary': 'Inter, system-ui, sans-serif',
-                'secondary': 'Roboto, Arial, sans-serif',
-                'accent': 'Poppins, sans-serif'
-            },
-            'classic': {
-                'primary': 'Georgia, serif',
-                'secondary': 'Arial, sans-serif',
-                'accent': 'Playfair Display, serif'
-            },
-            'tech': {
-                'primary': 'Fira Code, monospace',
-                'secondary': 'Source Sans Pro, sans-serif',
-                'accent': 'JetBrains Mono, monospace'
-            },
-            'elegant': {
-                'primary': 'Crimson Text, serif',
-                'secondary': 'Lato, sans-serif',
-                'accent': 'Libre Baskerville, serif'
-            }
+    })
+    
+    # Typography options
+    font_combinations = _freeze({
+        'modern': {
+            'primary': 'Inter, system-ui, sans-serif',
+            'secondary': 'Roboto, Arial, sans-serif',
+            'accent': 'Poppins, sans-serif'
+        },
+        'classic': {
+            'primary': 'Georgia, serif',
+            'secondary': 'Arial, sans-serif',
+            'accent': 'Playfair Display, serif'
+        },
+        'tech': {
+            'primary': 'Fira Code, monospace',
+            'secondary': 'Source Sans Pro, sans-serif',
+            'accent': 'JetBrains Mono, monospace'
+        },
+        'elegant': {
+            'primary': 'Crimson Text, serif',
+            'secondary': 'Lato, sans-serif',
+            'accent': 'Libre Baskerville, serif'
         }
+    })
+    
+    # Spacing systems
+    spacing_systems = _freeze({
+        'compact': {'base_px': 8, 'scale': 1.2},
+        'standard': {'base_px': 16, 'scale': 1.5},
+        'generous': {'base_px': 24, 'scale': 1.618}
+    })
+    
+    # Semantic colors are the same for every theme
+    SEMANTIC_COLORS = MappingProxyType(dict(zip(
+        ('success', 'warning', 'error', 'info'),
+        _hsl_batch_to_hex(np.array([[120, 0.6, 0.4], [45, 0.8, 0.5], [0, 0.7, 0.5], [200, 0.7, 0.5]]))
+    )))
+    
+    # Default theme, stamped with created_at whenever it is handed out
+    _default_theme_template = _freeze({
+        'name': 'Default Theme',
+        'description': 'Default application theme',
+        'colors': {
+            'primary': '#1A73E8',
+            'secondary': '#34A853',
+            'accent': '#EA4335',
+            'background': '#F8F9FA',
+            'text': '#202124'
+        },
+        'typography': {
+            'primary': 'Inter, sans-serif',
+            'secondary': 'Roboto, sans-serif',
+            'accent': 'Poppins, sans-serif'
+        },
+        'spacing': {
+            'base_px': 16,
+            'scale': '1.5'
+        },
+        'components': {}
+    })
+    
+    def __init__(self):
+        # Per-instance RNG for theme names, independent of the global random state
+        self._rng = random.Random()
         
-        # Spacing systems
-        self.spacing_systems = {
-            'compact': {'base': '8px', 'scale': 1.2},
-            'standard': {'base': '16px', 'scale': 1.5},
-            'generous': {'base': '24px', 'scale': 1.618}
-        }
+        # Per-instance cache so the instance itself is not part of the cache key
+        self._build_static_theme = functools.lru_cache(maxsize=512)(self._build_static_theme_uncached)
     
-    def generate_theme_from_prompt(self, prompt: str) -> Dict[str, Any]:
-        """Generate a theme based on a text prompt"""
+    def generate_theme_from_prompt(self, prompt: str, now_iso: Optional[str] = None) -> Dict[str, Any]:
+        """Generate a theme based on a text prompt; batch callers can share one now_iso timestamp"""
         try:
-            # Parse prompt for theme characteristics
-            theme_characteristics = self._parse_prompt(prompt)
-            
-            # Select base theme
-            base_theme_name = self._select_base_theme(theme_characteristics)
-            base_theme = self.base_themes[base_theme_name]
-            
-            # Generate color palette
-            color_palette = self._generate_color_palette(base_theme, theme_characteristics)
+            # Deterministic parts of the theme are cached per normalized prompt
+            theme_characteristics, core = self._build_static_theme(self._normalize_prompt(prompt))
             
-            # Select typography
-            typography = self._select_typography(theme_characteristics)
-            
-            # Select spacing system
-            spacing = self._select_spacing(theme_characteristics)
-            
-            # Generate component styles
-            component_styles = self._generate_component_styles(color_palette, typography, spacing)
-            
-            # Create complete theme
+            # Create complete theme; the cached core is shared, so hand out fresh copies
             theme = {
                 'name': self._generate_theme_name(theme_characteristics),
                 'description': f"Generated theme based on: {prompt}",
-                'base_theme': base_theme_name,
-                'colors': color_palette,
-                'typography': typography,
-                'spacing': spacing,
-                'components': component_styles,
-                'created_at': datetime.now().isoformat(),
+                **_fresh_copy(core),
+                'created_at': now_iso or datetime.now().isoformat(),
                 'prompt': prompt
             }
             
@@ -123,105 +317,94 @@ class ThemeGenerator:
             
         except Exception as e:
             logging.error(f"Error generating theme from prompt: {str(e)}")
-            return self._get_default_theme()
+            return self._get_default_theme(now_iso)
     
-    def _parse_prompt(self, prompt: str) -> Dict[str, Any]:
-        """Parse prompt to extract theme characteristics"""
+    def generate_theme_core(self, prompt: str) -> Dict[str, Any]:
+        """Generate only the colors, typography, spacing and components for a prompt"""
         try:
-            prompt_lower = prompt.lower()
-            
-            characteristics = {
-                'mood': 'neutral',
-                'style': 'modern',
-                'colors': [],
-                'energy': 'medium',
-                'formality': 'medium',
-                'contrast': 'medium'
-            }
-            
-            # Mood detection
-            if any(word in prompt_lower for word in ['calm', 'peaceful', 'serene', 'quiet']):
-                characteristics['mood'] = 'calm'
-            elif any(word in prompt_lower for word in ['energetic', 'vibrant', 'bold', 'dynamic']):
-                characteristics['mood'] = 'energetic'
-            elif any(word in prompt_lower for word in ['warm', 'cozy', 'welcoming', 'friendly']):
-                characteristics['mood'] = 'warm'
-            elif any(word in prompt_lower for word in ['cool', 'fresh', 'clean', 'minimal']):
-                characteristics['mood'] = 'cool'
-            
-            # Style detection
-            if any(word in prompt_lower for word in ['professional', 'business', 'corporate']):
-                characteristics['style'] = 'professional'
-            elif any(word in prompt_lower for word in ['modern', 'contemporary', 'sleek']):
-                characteristics['style'] = 'modern'
-            elif any(word in prompt_lower for word in ['classic', 'traditional', 'timeless']):
-                characteristics['style'] = 'classic'
-            elif any(word in prompt_lower for word in ['tech', 'digital', 'futuristic']):
-                characteristics['style'] = 'tech'
-            
-            # Color detection
-            color_keywords = {
-                'blue': ['blue', 'navy', 'azure', 'cyan'],
-                'green': ['green', 'emerald', 'forest', 'mint'],
-                'red': ['red', 'crimson', 'ruby', 'coral'],
-                'purple': ['purple', 'violet', 'lavender', 'magenta'],
-                'orange': ['orange', 'amber', 'peach', 'tangerine'],
-                'yellow': ['yellow', 'gold', 'sunshine', 'lemon'],
-                'pink': ['pink', 'rose', 'blush', 'salmon'],
-                'brown': ['brown', 'tan', 'beige', 'chocolate']
-            }
-            
-            for color, keywords in color_keywords.items():
-                if any(keyword in prompt_lower for keyword in keywords):
-                    characteristics['colors'].append(color)
-            
-            # Energy level
-            if any(word in prompt_lower for word in ['high', 'intense', 'strong', 'powerful']):
-                characteristics['energy'] = 'high'
-            elif any(word in prompt_lower for word in ['low', 'subtle', 'gentle', 'soft']):
-                characteristics['energy'] = 'low'
-            
-            # Formality level
-            if any(word in prompt_lower for word in ['formal', 'serious', 'official']):
-                characteristics['formality'] = 'high'
-            elif any(word in prompt_lower for word in ['casual', 'informal', 'relaxed']):
-                characteristics['formality'] = 'low'
-            
-            # Contrast level
-            if any(word in prompt_lower for word in ['high contrast', 'bold', 'stark']):
-                characteristics['contrast'] = 'high'
-            elif any(word in prompt_lower for word in ['low contrast', 'subtle', 'muted']):
-                characteristics['contrast'] = 'low'
-            
-            return characteristics
+            _, core = self._build_static_theme(self._normalize_prompt(prompt))
+            return _fresh_copy(core)
             
         except Exception as e:
-            logging.error(f"Error parsing prompt: {str(e)}")
-            return {'mood': 'neutral', 'style': 'modern', 'colors': [], 'energy': 'medium'}
+            logging.error(f"Error generating theme core from prompt: {str(e)}")
+            return {key: _fresh_copy(self._default_theme_template[key])
+                    for key in ('colors', 'typography', 'spacing', 'components')}
+    
+    def _normalize_prompt(self, prompt: str) -> str:
+        """Normalize a prompt into its cache key"""
+        return ' '.join(prompt.lower().split())
+    
+    def _build_static_theme_uncached(self, normalized_prompt: str) -> Tuple[Dict[str, Any], Mapping[str, Any]]:
+        """Build the deterministic parts of a theme for a normalized prompt"""
+        # Parse prompt for theme characteristics
+        theme_characteristics = self._parse_prompt(normalized_prompt)
+        
+        # Select base theme
+        base_theme_name = self._select_base_theme(theme_characteristics)
+        base_theme = self.base_themes[base_theme_name]
+        
+        # Generate color palette
+        color_palette = self._generate_color_palette(base_theme, theme_characteristics)
+        
+        # Select typography
+        typography = self._select_typography(theme_characteristics)
+        
+        # Select spacing system
+        spacing = self._select_spacing(theme_characteristics)
+        
+        # Generate component styles
+        component_styles = self._generate_component_styles(color_palette, typography, spacing)
+        
+        # Read-only view, since cached cores are shared between callers
+        core = MappingProxyType({
+            'base_theme': base_theme_name,
+            'colors': color_palette,
+            'typography': typography,
+            'spacing': spacing,
+            'components': component_styles
+        })
+        
+        return theme_characteristics, core
+    
+    def _parse_prompt(self, prompt: str) -> Dict[str, Any]:
+        """Parse prompt to extract theme characteristics"""
+        prompt_lower = prompt.lower()
+        
+        characteristics = {
+            'mood': 'neutral',
+            'style': 'modern',
+            'colors': [],
+            'energy': 'medium',
+            'formality': 'medium',
+            'contrast': 'medium'
+        }
+        
+        # Tokenize once; adjacent word pairs cover phrases like 'high contrast'
+        words = re.findall(r"[a-z]+", prompt_lower)
+        
+        tokens = set(words)
+        tokens.update(f"{first} {second}" for first, second in zip(words, words[1:]))
+        
+        # Earlier rules win for each field
+        assigned = set()
+        for field, value, keywords in PROMPT_KEYWORD_RULES:
+            if field not in assigned and keywords & tokens:
+                characteristics[field] = value
+                assigned.add(field)
+        
+        # Every matched color is kept, in color table order
+        found_colors = {self._COLOR_REVERSE[keyword] for keyword in tokens & self._COLOR_KEYWORD_SET}
+        characteristics['colors'] = [color for color in self._COLOR_KEYWORDS if color in found_colors]
+        
+        return characteristics
     
     def _select_base_theme(self, characteristics: Dict[str, Any]) -> str:
         """Select base theme based on characteristics"""
-        try:
-            mood = characteristics.get('mood', 'neutral')
-            style = characteristics.get('style', 'modern')
-            
-            # Map characteristics to base themes
-            if mood == 'calm':
-                return 'calm'
-            elif mood == 'energetic':
-                return 'vibrant'
-            elif mood == 'warm':
-                return 'warm'
-            elif mood == 'cool':
-                return 'cool'
-            elif style == 'professional':
-                return 'professional'
-            else:
-                return 'modern'
-                
-        except Exception as e:
-            logging.error(f"Error selecting base theme: {str(e)}")
-            return 'modern'
+        mood = characteristics.get('mood', 'neutral')
+        style = characteristics.get('style', 'modern')
+        
+        # Map characteristics to base themes; mood takes precedence over style
+        return _MOOD_TO_BASE.get(mood) or _STYLE_TO_BASE.get(style, 'modern')
     
     def _generate_color_palette(self, base_theme: Dict[str, Any], 
                                characteristics: Dict[str, Any]) -> Dict[str, str]:
@@ -240,37 +423,21 @@ class ThemeGenerator:
             elif energy == 'low':
                 saturation = max(0.1, saturation - 0.2)
             
-            # Generate primary colors
-            primary_color = self._hsl_to_hex(primary_hue, saturation, lightness)
-            secondary_color = self._hsl_to_hex(secondary_hue, saturation * 0.8, lightness + 0.1)
-            
-            # Generate supporting colors
-            accent_color = self._hsl_to_hex((primary_hue + 120) % 360, saturation, lightness)
-            
-            # Generate neutral colors
-            background_color = self._hsl_to_hex(primary_hue, saturation * 0.1, 0.98)
-            text_color = self._hsl_to_hex(primary_hue, saturation * 0.2, 0.15)
-            
-            # Generate semantic colors
-            success_color = self._hsl_to_hex(120, 0.6, 0.4)
-            warning_color = self._hsl_to_hex(45, 0.8, 0.5)
-            error_color = self._hsl_to_hex(0, 0.7, 0.5)
-            info_color = self._hsl_to_hex(200, 0.7, 0.5)
+            # Theme palette entries as (hue, saturation, lightness), converted in one batch
+            palette_hsl = (
+                ('primary', primary_hue, saturation, lightness),
+                ('secondary', secondary_hue, saturation * 0.8, lightness + 0.1),
+                ('accent', (primary_hue + 120) % 360, saturation, lightness),
+                ('background', primary_hue, saturation * 0.1, 0.98),
+                ('surface', primary_hue, saturation * 0.05, 0.95),
+                ('text', primary_hue, saturation * 0.2, 0.15),
+                ('text_secondary', primary_hue, saturation * 0.15, 0.4),
+                ('border', primary_hue, saturation * 0.1, 0.8)
+            )
             
-            palette = {
-                'primary': primary_color,
-                'secondary': secondary_color,
-                'accent': accent_color,
-                'background': background_color,
-                'surface': self._hsl_to_hex(primary_hue, saturation * 0.05, 0.95),
-                'text': text_color,
-                'text_secondary': self._hsl_to_hex(primary_hue, saturation * 0.15, 0.4),
-                'border': self._hsl_to_hex(primary_hue, saturation * 0.1, 0.8),
-                'success': success_color,
-                'warning': warning_color,
-                'error': error_color,
-                'info': info_color
-            }
+            hex_colors = _hsl_batch_to_hex(np.array([entry[1:] for entry in palette_hsl], dtype=np.float64))
+            palette = {entry[0]: hex_color for entry, hex_color in zip(palette_hsl, hex_colors)}
+            palette.update(self.SEMANTIC_COLORS)
             
             return palette
             
@@ -286,51 +453,34 @@ class ThemeGenerator:
     
     def _select_typography(self, characteristics: Dict[str, Any]) -> Dict[str, str]:
         """Select typography based on characteristics"""
-        try:
-            style = characteristics.get('style', 'modern')
-            formality = characteristics.get('formality', 'medium')
-            
-            if style == 'tech':
-                return self.font_combinations['tech']
-            elif style == 'classic' or formality == 'high':
-                return self.font_combinations['classic']
-            elif formality == 'low':
-                return self.font_combinations['modern']
-            else:
-                return self.font_combinations['elegant']
-                
-        except Exception as e:
-            logging.error(f"Error selecting typography: {str(e)}")
-            return self.font_combinations['modern']
+        style = characteristics.get('style', 'modern')
+        formality = characteristics.get('formality', 'medium')
+        
+        # Style takes precedence over formality
+        font_name = _STYLE_TO_FONTS.get(style) or _FORMALITY_TO_FONTS.get(formality, 'elegant')
+        return dict(self.font_combinations[font_name])
     
-    def _select_spacing(self, characteristics: Dict[str, Any]) -> Dict[str, str]:
+    def _select_spacing(self, characteristics: Dict[str, Any]) -> Dict[str, Any]:
         """Select spacing system based on characteristics"""
-        try:
-            energy = characteristics.get('energy', 'medium')
-            
-            if energy == 'high':
-                return self.spacing_systems['generous']
-            elif energy == 'low':
-                return self.spacing_systems['compact']
-            else:
-                return self.spacing_systems['standard']
-                
-        except Exception as e:
-            logging.error(f"Error selecting spacing: {str(e)}")
-            return self.spacing_systems['standard']
+        energy = characteristics.get('energy', 'medium')
+        
+        return dict(self.spacing_systems[_ENERGY_TO_SPACING.get(energy, 'standard')])
     
     def _generate_component_styles(self, colors: Dict[str, str], 
                                   typography: Dict[str, str], 
-                                  spacing: Dict[str, str]) -> Dict[str, Dict[str, str]]:
+                                  spacing: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
         """Generate component-specific styles"""
         try:
+            base_px = spacing['base_px']
+            base = _px(base_px)
+            
             components = {
                 'button': {
                     'background': colors['primary'],
                     'color': '#FFFFFF',
                     'font_family': typography['primary'],
-                    'padding': f"{spacing['base']} {self._multiply_spacing(spacing['base'], 2)}",
-                    'border_radius': self._multiply_spacing(spacing['base'], 0.5),
+                    'padding': f"{base} {self._multiply_spacing(base_px, 2)}",
+                    'border_radius': self._multiply_spacing(base_px, 0.5),
                     'border': 'none',
                     'font_weight': '600'
                 },
@@ -338,8 +488,8 @@ class ThemeGenerator:
                     'background': colors['surface'],
                     'color': colors['text'],
                     'font_family': typography['primary'],
-                    'padding': spacing['base'],
-                    'border_radius': self._multiply_spacing(spacing['base'], 0.5),
+                    'padding': base,
+                    'border_radius': self._multiply_spacing(base_px, 0.5),
                     'border': f"1px solid {colors['border']}",
                     'box_shadow': '0 2px 4px rgba(0,0,0,0.1)'
                 },
@@ -347,8 +497,8 @@ class ThemeGenerator:
                     'background': colors['background'],
                     'color': colors['text'],
                     'font_family': typography['primary'],
-                    'padding': self._multiply_spacing(spacing['base'], 0.75),
-                    'border_radius': self._multiply_spacing(spacing['base'], 0.25),
+                    'padding': self._multiply_spacing(base_px, 0.75),
+                    'border_radius': self._multiply_spacing(base_px, 0.25),
                     'border': f"1px solid {colors['border']}",
                     'font_size': '16px'
                 },
@@ -357,14 +507,14 @@ class ThemeGenerator:
                     'font_family': typography['accent'],
                     'font_weight': '700',
                     'line_height': '1.2',
-                    'margin_bottom': spacing['base']
+                    'margin_bottom': base
                 },
                 'paragraph': {
                     'color': colors['text_secondary'],
                     'font_family': typography['primary'],
                     'font_size': '16px',
                     'line_height': '1.6',
-                    'margin_bottom': spacing['base']
+                    'margin_bottom': base
                 }
             }
             
@@ -374,73 +524,19 @@ class ThemeGenerator:
             logging.error(f"Error generating component styles: {str(e)}")
             return {}
     
-    def _hsl_to_hex(self, hue: float, saturation: float, lightness: float) -> str:
-        """Convert HSL to hex color"""
-        try:
-            # Normalize values
-            h = hue / 360
-            s = saturation
-            l = lightness
-            
-            # Convert to RGB
-            rgb = colorsys.hls_to_rgb(h, l, s)
-            
-            # Convert to hex
-            hex_color = '#%02x%02x%02x' % (
-                int(rgb[0] * 255),
-                int(rgb[1] * 255),
-                int(rgb[2] * 255)
-            )
-            
-            return hex_color.upper()
-            
-        except Exception as e:
-            logging.error(f"Error converting HSL to hex: {str(e)}")
-            return '#000000'
-    
-    def _multiply_spacing(self, base_spacing: str, multiplier: float) -> str:
+    def _multiply_spacing(self, base_px: int, multiplier: float) -> str:
         """Multiply spacing value"""
-        try:
-            # Extract numeric value
-            numeric_value = float(base_spacing.replace('px', ''))
-            
-            # Multiply and format
-            new_value = numeric_value * multiplier
-            return f"{int(new_value)}px"
-            
-        except Exception as e:
-            logging.error(f"Error multiplying spacing: {str(e)}")
-            return base_spacing
+        return _px(int(base_px * multiplier))
     
     def _generate_theme_name(self, characteristics: Dict[str, Any]) -> str:
         """Generate a name for the theme"""
-        try:
-            mood = characteristics.get('mood', 'neutral')
-            style = characteristics.get('style', 'modern')
-            
-            adjectives = {
-                'calm': ['Serene', 'Peaceful', 'Tranquil'],
-                'energetic': ['Dynamic', 'Vibrant', 'Bold'],
-                'warm': ['Cozy', 'Welcoming', 'Friendly'],
-                'cool': ['Fresh', 'Clean', 'Crisp'],
-                'neutral': ['Balanced', 'Classic', 'Timeless']
-            }
-            
-            nouns = {
-                'modern': ['Edge', 'Flow', 'Pulse'],
-                'professional': ['Suite', 'Pro', 'Executive'],
-                'classic': ['Heritage', 'Vintage', 'Tradition'],
-                'tech': ['Code', 'Digital', 'Matrix']
-            }
-            
-            adjective = random.choice(adjectives.get(mood, ['Custom']))
-            noun = random.choice(nouns.get(style, ['Theme']))
-            
-            return f"{adjective} {noun}"
-            
-        except Exception as e:
-            logging.error(f"Error generating theme name: {str(e)}")
-            return "Custom Theme"
+        mood = characteristics.get('mood', 'neutral')
+        style = characteristics.get('style', 'modern')
+        
+        adjective = self._rng.choice(self._ADJECTIVES.get(mood, ('Custom',)))
+        noun = self._rng.choice(self._NOUNS.get(style, ('Theme',)))
+        
+        return f"{adjective} {noun}"
     
     def generate_css(self, theme: Dict[str, Any]) -> str:
         """Generate CSS from theme data"""
@@ -450,55 +546,31 @@ class ThemeGenerator:
             spacing = theme.get('spacing', {})
             components = theme.get('components', {})
             
-            css = f"""
-            /* {theme.get('name', 'Custom Theme')} */
-            /* Generated on {theme.get('created_at', datetime.now().isoformat())} */
+            # Themes saved before spacing became integer pixels carry a 'base' string
+            base_px = spacing.get('base_px')
+            spacing_base = _px(base_px) if base_px is not None else spacing.get('base', '16px')
             
-            :root {{
-                /* Colors */
-                --primary: {colors.get('primary', '#1A73E8')};
-                --secondary: {colors.get('secondary', '#34A853')};
-                --accent: {colors.get('accent', '#EA4335')};
-                --background: {colors.get('background', '#F8F9FA')};
-                --surface: {colors.get('surface', '#FFFFFF')};
-                --text: {colors.get('text', '#202124')};
-                --text-secondary: {colors.get('text_secondary', '#5F6368')};
-                --border: {colors.get('border', '#DADCE0')};
-                --success: {colors.get('success', '#34A853')};
-                --warning: {colors.get('warning', '#FBBC04')};
-                --error: {colors.get('error', '#EA4335')};
-                --info: {colors.get('info', '#1A73E8')};
-                
-                /* Typography */
-                --font-primary: {typography.get('primary', 'Inter, sans-serif')};
-                --font-secondary: {typography.get('secondary', 'Roboto, sans-serif')};
-                --font-accent: {typography.get('accent', 'Poppins, sans-serif')};
-                
-                /* Spacing */
-                --spacing-base: {spacing.get('base', '16px')};
-                --spacing-scale: {spacing.get('scale', '1.5')};
-            }}
-            
-            /* Global Styles */
-            body {{
-                font-family: var(--font-primary);
-                color: var(--text);
-                background-color: var(--background);
-                line-height: 1.6;
-            }}
-            
-            /* Component Styles */
-            """
+            # Theme values shadow the defaults; typography and spacing keys are prefixed
+            parts = [_CSS_ROOT_TEMPLATE.format_map(ChainMap(
+                {
+                    'name': theme.get('name', 'Custom Theme'),
+                    'created_at': theme['created_at'] if 'created_at' in theme else datetime.now().isoformat(),
+                    'spacing_base': spacing_base
+                },
+                colors,
+                {f"font_{key}": value for key, value in typography.items()},
+                {f"spacing_{key}": value for key, value in spacing.items()},
+                _CSS_DEFAULTS
+            ))]
             
             # Add component styles
             for component, styles in components.items():
-                css += f"\n.{component} {{\n"
-                for property, value in styles.items():
-                    css_property = property.replace('_', '-')
-                    css += f"    {css_property}: {value};\n"
-                css += "}\n"
+                parts.append(f"\n.{component} {{\n")
+                parts.extend(f"    {property.translate(_CSS_PROPERTY_TABLE)}: {value};\n"
+                             for property, value in styles.items())
+                parts.append("}\n")
             
-            return css
+            return ''.join(parts)
             
         except Exception as e:
             logging.error(f"Error generating CSS: {str(e)}")
@@ -507,8 +579,12 @@ class ThemeGenerator:
     def save_theme(self, theme: Dict[str, Any], filename: str) -> bool:
         """Save theme to file"""
         try:
-            with open(filename, 'w') as f:
-                json.dump(theme, f, indent=2)
+            if orjson is not None:
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(theme, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filename, 'w') as f:
+                    json.dump(theme, f, indent=2)
             return True
             
         except Exception as e:
@@ -518,35 +594,18 @@ class ThemeGenerator:
     def load_theme(self, filename: str) -> Optional[Dict[str, Any]]:
         """Load theme from file"""
         try:
-            with open(filename, 'r') as f:
-                theme = json.load(f)
+            if orjson is not None:
+                with open(filename, 'rb') as f:
+                    theme = orjson.loads(f.read())
+            else:
+                with open(filename, 'r') as f:
+                    theme = json.load(f)
             return theme
             
         except Exception as e:
             logging.error(f"Error loading theme: {str(e)}")
             return None
     
-    def _get_default_theme(self) -> Dict[str, Any]:
+    def _get_default_theme(self, now_iso: Optional[str] = None) -> Dict[str, Any]:
         """Get default theme"""
-        return {
-            'name': 'Default Theme',
-            'description': 'Default application theme',
-            'colors': {
-                'primary': '#1A73E8',
-                'secondary': '#34A853',
-                'accent': '#EA4335',
-                'background': '#F8F9FA',
-                'text': '#202124'
-            },
-            'typography': {
-                'primary': 'Inter, sans-serif',
-                'secondary': 'Roboto, sans-serif',
-                'accent': 'Poppins, sans-serif'
-            },
-            'spacing': {
-                'base': '16px',
-                'scale': '1.5'
-            },
-            'components': {},
-            'created_at': datetime.now().isoformat()
-        }
+        return {**_fresh_copy(self._default_theme_template), 'created_at': now_iso or datetime.now().isoformat()}
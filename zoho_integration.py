@@ -1,11 +1,306 @@
-import requests
+import copy
+import httpx
 import json
-from datetime import datetime
-from typing import Dict, List, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from datetime import date, datetime
+from types import MappingProxyType
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
 import os
 from config import ZOHO_CLIENT_ID, ZOHO_CLIENT_SECRET
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import h2
+except ImportError:
+    h2 = None
+
+# Fixed fields of each outgoing payload; per-call fields are overlaid on top
+_CRM_CONTACT_BASE = {"Lead_Source": "News Platform"}
+_CRM_DEAL_BASE = {"Lead_Source": "News Platform"}
+_BOOKS_CUSTOMER_BASE = {"contact_type": "customer", "customer_sub_type": "individual"}
+_BOOKS_INVOICE_BASE = {"payment_terms": 15, "payment_terms_label": "Net 15"}
+_COMMERCE_PRODUCT_BASE = {"status": "active"}
+_COMMERCE_ORDER_BASE = {"order_status": "confirmed"}
+_INVENTORY_ITEM_BASE = {"item_type": "service", "product_type": "service", "is_taxable": True, "status": "active"}
+_CAMPAIGN_BASE = {"campaign_type": "regular"}
+
+def _now_iso() -> str:
+    """Current local time as an ISO timestamp"""
+    return datetime.now().isoformat()
+
+class _Spec(NamedTuple):
+    """Flat single-record call; callable field defaults are called per record"""
+    service: str
+    endpoint: str
+    method: str
+    fixed: Dict[str, Any]
+    fields: Dict[str, Tuple[str, Any]]
+
+# Spec key -> _Spec, with fields mapping payload field -> (input key, default)
+_SPECS = {
+    "crm_contact": _Spec("crm", "Contacts", "POST", _CRM_CONTACT_BASE, {
+        "First_Name": ("first_name", ""),
+        "Last_Name": ("last_name", ""),
+        "Email": ("email", ""),
+        "Phone": ("phone", ""),
+        "Company": ("company", ""),
+        "Title": ("title", ""),
+        "Subscription_Tier": ("subscription_tier", "free"),
+        "Registration_Date": ("registration_date", _now_iso)
+    }),
+    "crm_deal": _Spec("crm", "Deals", "POST", _CRM_DEAL_BASE, {
+        "Deal_Name": ("deal_name", ""),
+        "Stage": ("stage", "Qualification"),
+        "Amount": ("amount", 0),
+        "Contact_Name": ("contact_id", ""),
+        "Closing_Date": ("closing_date", ""),
+        "Type": ("type", "Subscription")
+    }),
+    "product": _Spec("commerce", "products", "POST", _COMMERCE_PRODUCT_BASE, {
+        "name": ("name", ""),
+        "description": ("description", ""),
+        "price": ("price", 0),
+        "category": ("category", ""),
+        "sku": ("sku", ""),
+        "stock_quantity": ("stock_quantity", 0),
+        "digital_product": ("digital_product", True)
+    }),
+    "order": _Spec("commerce", "orders", "POST", _COMMERCE_ORDER_BASE, {
+        "customer_id": ("customer_id", ""),
+        "order_items": ("items", list),
+        "billing_address": ("billing_address", dict),
+        "shipping_address": ("shipping_address", dict),
+        "payment_method": ("payment_method", ""),
+        "total_amount": ("total_amount", 0)
+    }),
+    "item": _Spec("inventory", "items", "POST", _INVENTORY_ITEM_BASE, {
+        "name": ("name", ""),
+        "description": ("description", ""),
+        "rate": ("price", 0),
+        "sku": ("sku", ""),
+        "category_id": ("category_id", "")
+    }),
+    "item_stock": _Spec("inventory", "items/{}/stock", "PUT", {}, {
+        "quantity_available": ("quantity", 0),
+        "warehouse_id": ("warehouse_id", "")
+    }),
+    "list_contact": _Spec("campaigns", "lists/{}/contacts", "POST", {}, {
+        "contact_email": ("email", ""),
+        "contact_name": ("name", ""),
+        "first_name": ("first_name", ""),
+        "last_name": ("last_name", ""),
+        "phone": ("phone", "")
+    })
+}
+
+@dataclass(slots=True)
+class CustomerIn:
+    """Zoho Books customer fields read from a caller's record"""
+    name: str = ""
+    first_name: str = ""
+    last_name: str = ""
+    email: str = ""
+    phone: str = ""
+    address: str = ""
+    city: str = ""
+    state: str = ""
+    zip: str = ""
+    country: str = ""
+
+@dataclass(slots=True)
+class InvoiceIn:
+    """Zoho Books subscription invoice fields; a date of None means today"""
+    customer_id: str = ""
+    invoice_number: str = ""
+    date: Optional[str] = None
+    due_date: str = ""
+    subscription_name: str = "News Subscription"
+    description: str = "Monthly news subscription"
+    amount: float = 0
+    tax_id: str = ""
+
+@dataclass(slots=True)
+class PaymentIn:
+    """Zoho Books customer payment fields; a date of None means today"""
+    customer_id: str = ""
+    payment_method: str = "online"
+    amount: float = 0
+    date: Optional[str] = None
+    reference_number: str = ""
+    description: str = "Subscription payment"
+    invoice_id: str = ""
+
+def _coerce(cls, data):
+    """Turn a caller's dict into the given input dataclass once, converting each field to its type"""
+    if isinstance(data, cls):
+        return data
+    
+    # Callers pass whole user or subscription records, so keys outside the dataclass are skipped;
+    # a missing or None value keeps the field default
+    values = {}
+    for field in fields(cls):
+        value = data.get(field.name)
+        if value is None:
+            continue
+        
+        if field.type is float:
+            if isinstance(value, str):
+                try:
+                    value = float(value)
+                except ValueError:
+                    raise ValueError(f"{cls.__name__}.{field.name} is not a number: {value!r}") from None
+            elif isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise TypeError(f"{cls.__name__}.{field.name} expects a number, got {type(value).__name__}")
+        elif isinstance(value, date):
+            value = value.strftime("%Y-%m-%d")
+        elif isinstance(value, (str, int, float)) and not isinstance(value, bool):
+            value = str(value)
+        else:
+            raise TypeError(f"{cls.__name__}.{field.name} expects a string, got {type(value).__name__}")
+        
+        values[field.name] = value
+    
+    return cls(**values)
+
+def _encode_json(data) -> bytes:
+    """Serialize a request body to JSON bytes, with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+def _decode_json(content: bytes):
+    """Parse a JSON response body, with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+class JsonFieldStream:
+    """Re-iterable JSON request body that streams one large string field in chunks"""
+    
+    CHUNK_CHARS = 64 * 1024
+    
+    def __init__(self, payload: Dict, field: str):
+        self.payload = payload
+        self.field = field
+    
+    def __iter__(self):
+        # The large field goes first, escaped slice by slice, then the rest of the object
+        value = self.payload[self.field]
+        rest = _encode_json({key: val for key, val in self.payload.items() if key != self.field})
+        
+        yield b"{" + _encode_json(self.field) + b":\""
+        for start in range(0, len(value), self.CHUNK_CHARS):
+            yield _encode_json(value[start:start + self.CHUNK_CHARS])[1:-1]
+        yield b"\"" + (b"," + rest[1:] if len(rest) > 2 else b"}")
+
+class RetryTransport(httpx.HTTPTransport):
+    """HTTP transport that retries idempotent requests on transient server errors with backoff"""
+    
+    # 429 is left to the caller, which backs off the whole service through its rate limiter
+    RETRY_STATUSES = frozenset({500, 502, 503, 504})
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+    
+    # Longest Retry-After honoured, since the sleep holds the caller's in-flight slot
+    MAX_RETRY_AFTER = 5.0
+    
+    def __init__(self, total: int = 3, backoff_factor: float = 0.3, **kwargs):
+        super().__init__(retries=total, **kwargs)
+        self.total = total
+        self.backoff_factor = backoff_factor
+    
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response = super().handle_request(request)
+        
+        attempt = 0
+        while (response.status_code in self.RETRY_STATUSES and request.method in self.IDEMPOTENT_METHODS
+               and attempt < self.total):
+            response.close()
+            
+            # Honour a numeric Retry-After, otherwise back off exponentially
+            retry_after = response.headers.get("Retry-After", "")
+            delay = float(retry_after) if retry_after.isdigit() else self.backoff_factor * (2 ** attempt)
+            time.sleep(min(delay, self.MAX_RETRY_AFTER))
+            
+            attempt += 1
+            response = super().handle_request(request)
+        
+        return response
+
+class TokenBucket:
+    """Thread-safe token bucket that paces calls to a steady rate"""
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Take one token, sleeping until it is available"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            
+            # Reserve the token now so concurrent callers queue up behind each other
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        
+        if wait:
+            time.sleep(wait)
+    
+    def pause(self, seconds: float):
+        """Hold the next call off for at least the given number of seconds"""
+        with self._lock:
+            self.tokens = min(self.tokens, 1 - seconds * self.rate)
+    
+    def drain(self):
+        """Empty the bucket so the next call waits for a fresh token"""
+        with self._lock:
+            self.tokens = min(self.tokens, 0)
+
 class ZohoIntegration:
+    # Worker threads for overlapping independent calls to different Zoho services
+    _executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="zoho")
+    
+    # Seconds before the real expiry at which a token is treated as expired
+    _EXPIRY_MARGIN = 60
+    
+    # Seconds a failed refresh is reused before /token is tried again, since Zoho
+    # rate-limits token issuance
+    _REFRESH_BACKOFF = 60
+    
+    # Most records Zoho CRM accepts in one insert call
+    _CRM_BATCH_SIZE = 100
+    
+    # Outbound pacing per service, with a small burst allowance
+    _REQUESTS_PER_MINUTE = 100
+    _REQUEST_BURST = 10
+    
+    # In-flight requests across all threads, matching the connection pool size
+    _MAX_IN_FLIGHT = 20
+    
+    # Seconds to wait on any single Zoho call
+    _REQUEST_TIMEOUT = 30.0
+    
+    # Longest Retry-After honoured on a 429 before the single retry
+    _MAX_RETRY_AFTER = 30.0
+    
+    # HTTP methods that send the JSON payload as a request body
+    _BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+    
+    # Analytics reports are reused for this many seconds, across at most this many keys
+    _ANALYTICS_TTL = 60
+    _ANALYTICS_CACHE_SIZE = 32
+    
     def __init__(self):
         self.client_id = ZOHO_CLIENT_ID
         self.client_secret = ZOHO_CLIENT_SECRET
@@ -14,15 +309,61 @@ class ZohoIntegration:
         self.access_token = None
         self.refresh_token = None
         
-        # Service endpoints
-        self.services = {
+        # Token deadline on the monotonic clock, refreshed ahead of expiry by a timer
+        self._expires_at = None
+        self._refresh_timer = None
+        self._refresh_lock = threading.Lock()
+        self._refresh_generation = 0
+        self._last_refresh = None
+        self._refresh_retry_at = None
+        
+        # Service endpoints, plus URL prefixes that endpoints are appended to directly
+        self.services = MappingProxyType({
             "crm": f"{self.base_url}/crm/v2",
             "books": f"{self.base_url}/books/v3",
             "commerce": f"{self.base_url}/commerce/v1",
             "inventory": f"{self.base_url}/inventory/v1",
             "creator": f"{self.base_url}/creator/v2",
             "campaigns": f"{self.base_url}/campaigns/v1"
+        })
+        self._service_prefix = {service: url + "/" for service, url in self.services.items()}
+        
+        # Proactive throttling keeps us under Zoho's per-service limits instead of retrying 429s
+        self._limiters = {
+            service: TokenBucket(self._REQUESTS_PER_MINUTE / 60, self._REQUEST_BURST)
+            for service in self.services
         }
+        self._request_slots = threading.BoundedSemaphore(self._MAX_IN_FLIGHT)
+        
+        # (report, date_range) -> (expires_at, result) for repeated dashboard polls
+        self._analytics_cache = {}
+        
+        # Shared client keeps connections to the API and auth hosts alive between calls; with h2
+        # installed, concurrent fan-outs multiplex over one HTTP/2 connection per host
+        self.session = httpx.Client(
+            transport=RetryTransport(
+                http2=h2 is not None,
+                limits=httpx.Limits(max_keepalive_connections=self._MAX_IN_FLIGHT,
+                                    max_connections=self._MAX_IN_FLIGHT * 2)
+            ),
+            timeout=self._REQUEST_TIMEOUT
+        )
+    
+    @property
+    def access_token(self) -> Optional[str]:
+        """Current OAuth access token"""
+        return self._access_token
+    
+    @access_token.setter
+    def access_token(self, token: Optional[str]):
+        # API calls carry these headers, rebuilt here so a token restored by assignment is sent too;
+        # token endpoint posts are form-encoded and go without them
+        headers = {"Content-Type": "application/json"}
+        if token:
+            headers["Authorization"] = f"Zoho-oauthtoken {token}"
+        
+        self._access_token = token
+        self._api_headers = headers
     
     def get_access_token(self, authorization_code: str) -> Dict:
         """Get access token using authorization code"""
@@ -35,99 +376,203 @@ class ZohoIntegration:
                 "redirect_uri": "https://your-domain.com/zoho/callback"
             }
             
-            response = requests.post(f"{self.auth_url}/token", data=data)
+            response = self.session.post(f"{self.auth_url}/token", data=data)
             
-            if response.status_code == 200:
-                token_data = response.json()
-                self.access_token = token_data["access_token"]
-                self.refresh_token = token_data["refresh_token"]
-                return token_data
-            else:
-                return {"error": "Failed to get access token"}
+            token_data = _decode_json(response.content) if response.status_code == 200 else {}
+            
+            # Zoho reports a bad code with a 200 and an "error" field instead of a token
+            if "access_token" not in token_data:
+                return {"error": token_data.get("error", "Failed to get access token")}
+            
+            self.refresh_token = token_data.get("refresh_token", self.refresh_token)
+            self._store_token(token_data)
+            return token_data
                 
-        except Exception as e:
+        except (httpx.HTTPError, ValueError) as e:
             return {"error": str(e)}
     
     def refresh_access_token(self) -> Dict:
         """Refresh access token"""
-        try:
-            data = {
-                "grant_type": "refresh_token",
-                "client_id": self.client_id,
-                "client_secret": self.client_secret,
-                "refresh_token": self.refresh_token
-            }
+        data = {
+            "grant_type": "refresh_token",
+            "client_id": self.client_id,
+            "client_secret": self.client_secret,
+            "refresh_token": self.refresh_token
+        }
+        
+        # Callers that pile up behind an in-flight refresh share its result
+        generation = self._refresh_generation
+        with self._refresh_lock:
+            if self._refresh_generation != generation:
+                return self._last_refresh
             
-            response = requests.post(f"{self.auth_url}/token", data=data)
+            # A recent failure is reused rather than retried on every API call
+            if self._refresh_retry_at is not None and time.monotonic() < self._refresh_retry_at:
+                return self._last_refresh
             
-            if response.status_code == 200:
-                token_data = response.json()
-                self.access_token = token_data["access_token"]
-                return token_data
-            else:
-                return {"error": "Failed to refresh token"}
+            try:
+                response = self.session.post(f"{self.auth_url}/token", data=data)
                 
-        except Exception as e:
-            return {"error": str(e)}
+                token_data = _decode_json(response.content) if response.status_code == 200 else {}
+                
+                # A revoked refresh token comes back as a 200 with an "error" field
+                if "access_token" in token_data:
+                    self._store_token(token_data)
+                    self._last_refresh = token_data
+                else:
+                    self._last_refresh = {"error": token_data.get("error", "Failed to refresh token")}
+                    
+            except (httpx.HTTPError, ValueError) as e:
+                self._last_refresh = {"error": str(e)}
+            
+            if "error" in self._last_refresh:
+                # Stop pre-flight refreshes; a later 401 retries once the backoff has passed
+                self._expires_at = None
+                self._refresh_retry_at = time.monotonic() + self._REFRESH_BACKOFF
+            
+            self._refresh_generation += 1
+            return self._last_refresh
+    
+    def _store_token(self, token_data: Dict):
+        """Install a new access token and schedule its refresh before it expires"""
+        self.access_token = token_data["access_token"]
+        self._refresh_retry_at = None
+        
+        expires_in = token_data.get("expires_in")
+        if expires_in:
+            self._expires_at = time.monotonic() + expires_in - self._EXPIRY_MARGIN
+            self._schedule_refresh(expires_in * 0.8)
+    
+    def _schedule_refresh(self, delay: float):
+        """Refresh the access token in the background after delay seconds"""
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+        
+        self._refresh_timer = threading.Timer(delay, self.refresh_access_token)
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+    
+    def _near_expiry(self) -> bool:
+        """Whether the cached token is past its refresh deadline"""
+        return self._expires_at is not None and time.monotonic() >= self._expires_at
+    
+    def _ensure_token(self) -> Optional[Dict]:
+        """Refresh the access token before use if it is near expiry, returning the refresh result"""
+        if self._near_expiry():
+            return self.refresh_access_token()
+        return None
     
     def make_api_request(self, service: str, endpoint: str, method: str = "GET", 
                         data: Dict = None, params: Dict = None) -> Dict:
         """Make API request to Zoho service"""
+        # An unknown service is a caller bug, not a transport failure
+        if service not in self._service_prefix:
+            raise ValueError(f"Unknown Zoho service: {service}")
+        
         try:
             if not self.access_token:
                 return {"error": "No access token available"}
             
-            headers = {
-                "Authorization": f"Zoho-oauthtoken {self.access_token}",
-                "Content-Type": "application/json"
-            }
+            # Refresh up front rather than paying for a 401 and a retry
+            preflight = self._ensure_token()
             
-            url = f"{self.services[service]}/{endpoint}"
+            url = self._service_prefix[service] + endpoint
+            limiter = self._limiters[service]
             
-            if method == "GET":
-                response = requests.get(url, headers=headers, params=params)
-            elif method == "POST":
-                response = requests.post(url, headers=headers, json=data)
-            elif method == "PUT":
-                response = requests.put(url, headers=headers, json=data)
-            elif method == "DELETE":
-                response = requests.delete(url, headers=headers)
+            # Encode once for write methods; streamed bodies are re-iterable, so retries
+            # resend them without buffering
+            if isinstance(data, JsonFieldStream):
+                body = data
             else:
-                return {"error": "Unsupported HTTP method"}
+                body = _encode_json(data) if data is not None and method in self._BODY_METHODS else None
+            
+            response = self._send(limiter, method, url, body, params)
+            
+            if response.status_code == 429:
+                # Throttled anyway, so back the whole service off and try once more
+                limiter.pause(self._retry_after(response))
+                response = self._send(limiter, method, url, body, params)
+            elif response.headers.get("X-RateLimit-Remaining") == "0":
+                limiter.drain()
             
-            if response.status_code == 401:
-                # Token expired, try to refresh
-                refresh_result = self.refresh_access_token()
-                if "error" not in refresh_result:
-                    # Retry request with new token
-                    headers["Authorization"] = f"Zoho-oauthtoken {self.access_token}"
-                    response = requests.request(method, url, headers=headers, json=data, params=params)
+            if response.status_code == 401 and preflight is None:
+                # Only a server-side revocation or clock skew gets here after the pre-flight check;
+                # a call that already refreshed up front does not ask /token a second time
+                response = self._retry_after_refresh(limiter, method, url, body, params, response)
             
-            return response.json() if response.content else {"status": "success"}
+            # Error pages are often HTML, so report the status instead of parsing them
+            if response.status_code >= 400:
+                return {"error": f"HTTP {response.status_code}: {response.reason_phrase}", "status": response.status_code}
             
-        except Exception as e:
+            if response.status_code == 204 or not response.content:
+                return {"status": "success"}
+            
+            return _decode_json(response.content)
+            
+        except (httpx.HTTPError, ValueError) as e:
             return {"error": str(e)}
     
+    def _send(self, limiter: TokenBucket, method: str, url: str, body, params: Optional[Dict]) -> httpx.Response:
+        """Issue one API call under the service rate limit and the in-flight cap"""
+        limiter.acquire()
+        with self._request_slots:
+            return self.session.request(method, url, content=body, params=params, headers=self._api_headers)
+    
+    def _retry_after_refresh(self, limiter: TokenBucket, method: str, url: str, body, params: Optional[Dict],
+                             response: httpx.Response) -> httpx.Response:
+        """Refresh a rejected token and resend the already-encoded request once"""
+        refresh_result = self.refresh_access_token()
+        if "error" in refresh_result:
+            return response
+        
+        return self._send(limiter, method, url, body, params)
+    
+    def _retry_after(self, response: httpx.Response) -> float:
+        """Seconds to wait after a 429, from the Retry-After header when it is numeric, capped"""
+        try:
+            return min(float(response.headers.get("Retry-After", 1)), self._MAX_RETRY_AFTER)
+        except ValueError:
+            return 1.0
+    
+    def _build_record(self, spec_key: str, payload: Dict) -> Dict:
+        """Build the record for a _SPECS entry from caller-supplied fields"""
+        spec = _SPECS[spec_key]
+        record = dict(spec.fixed)
+        
+        for field, (key, default) in spec.fields.items():
+            if key in payload:
+                record[field] = payload[key]
+            else:
+                record[field] = default() if callable(default) else default
+        
+        return record
+    
+    def _build_and_send(self, spec_key: str, payload: Dict, *path_args: str) -> Dict:
+        """Send a _SPECS record; path_args fill the endpoint template"""
+        spec = _SPECS[spec_key]
+        record = self._build_record(spec_key, payload)
+        
+        # CRM modules take a list of records under "data"
+        data = {"data": [record]} if spec.service == "crm" else record
+        
+        return self.make_api_request(spec.service, spec.endpoint.format(*path_args), spec.method, data)
+    
     # CRM Integration
     def create_crm_contact(self, contact_data: Dict) -> Dict:
         """Create contact in Zoho CRM"""
-        data = {
-            "data": [
-                {
-                    "First_Name": contact_data.get("first_name", ""),
-                    "Last_Name": contact_data.get("last_name", ""),
-                    "Email": contact_data.get("email", ""),
-                    "Phone": contact_data.get("phone", ""),
-                    "Lead_Source": "News Platform",
-                    "Company": contact_data.get("company", ""),
-                    "Title": contact_data.get("title", ""),
-                    "Subscription_Tier": contact_data.get("subscription_tier", "free"),
-                    "Registration_Date": contact_data.get("registration_date", datetime.now().isoformat())
-                }
-            ]
-        }
-        
-        return self.make_api_request("crm", "Contacts", "POST", data)
+        return self._build_and_send("crm_contact", contact_data)
+    
+    def create_crm_deal(self, deal_data: Dict) -> Dict:
+        """Create deal in Zoho CRM"""
+        return self._build_and_send("crm_deal", deal_data)
+    
+    def create_crm_contacts(self, contacts: List[Dict]) -> List[Dict]:
+        """Create many contacts in Zoho CRM, one call per batch of records"""
+        return self._create_crm_records("Contacts", [self._build_record("crm_contact", c) for c in contacts])
+    
+    def create_crm_deals(self, deals: List[Dict]) -> List[Dict]:
+        """Create many deals in Zoho CRM, one call per batch of records"""
+        return self._create_crm_records("Deals", [self._build_record("crm_deal", d) for d in deals])
     
     def update_crm_contact(self, contact_id: str, contact_data: Dict) -> Dict:
         """Update contact in Zoho CRM"""
@@ -137,85 +582,82 @@ class ZohoIntegration:
         
         return self.make_api_request("crm", f"Contacts/{contact_id}", "PUT", data)
     
-    def create_crm_deal(self, deal_data: Dict) -> Dict:
-        """Create deal in Zoho CRM"""
-        data = {
-            "data": [
-                {
-                    "Deal_Name": deal_data.get("deal_name", ""),
-                    "Stage": deal_data.get("stage", "Qualification"),
-                    "Amount": deal_data.get("amount", 0),
-                    "Contact_Name": deal_data.get("contact_id", ""),
-                    "Closing_Date": deal_data.get("closing_date", ""),
-                    "Type": deal_data.get("type", "Subscription"),
-                    "Lead_Source": "News Platform"
-                }
-            ]
-        }
+    def _create_crm_records(self, module: str, records: List[Dict]) -> List[Dict]:
+        """Insert records into a CRM module in batches, returning one result per record"""
+        results = []
+        
+        for start in range(0, len(records), self._CRM_BATCH_SIZE):
+            batch = records[start:start + self._CRM_BATCH_SIZE]
+            response = self.make_api_request("crm", module, "POST", {"data": batch})
+            
+            # Zoho answers with one entry per record, in request order
+            if isinstance(response.get("data"), list) and len(response["data"]) == len(batch):
+                results.extend(response["data"])
+            else:
+                results.extend([response] * len(batch))
         
-        return self.make_api_request("crm", "Deals", "POST", data)
+        return results
     
     # Books Integration
-    def create_customer(self, customer_data: Dict) -> Dict:
+    def create_customer(self, customer_data: Union[CustomerIn, Dict]) -> Dict:
         """Create customer in Zoho Books"""
-        data = {
-            "contact_name": customer_data.get("name", ""),
-            "contact_type": "customer",
-            "customer_sub_type": "individual",
+        customer = _coerce(CustomerIn, customer_data)
+        data = _BOOKS_CUSTOMER_BASE | {
+            "contact_name": customer.name,
             "contact_persons": [
                 {
-                    "first_name": customer_data.get("first_name", ""),
-                    "last_name": customer_data.get("last_name", ""),
-                    "email": customer_data.get("email", ""),
-                    "phone": customer_data.get("phone", "")
+                    "first_name": customer.first_name,
+                    "last_name": customer.last_name,
+                    "email": customer.email,
+                    "phone": customer.phone
                 }
             ],
             "billing_address": {
-                "address": customer_data.get("address", ""),
-                "city": customer_data.get("city", ""),
-                "state": customer_data.get("state", ""),
-                "zip": customer_data.get("zip", ""),
-                "country": customer_data.get("country", "")
+                "address": customer.address,
+                "city": customer.city,
+                "state": customer.state,
+                "zip": customer.zip,
+                "country": customer.country
             }
         }
         
         return self.make_api_request("books", "contacts", "POST", data)
     
-    def create_subscription_invoice(self, invoice_data: Dict) -> Dict:
+    def create_subscription_invoice(self, invoice_data: Union[InvoiceIn, Dict]) -> Dict:
         """Create subscription invoice in Zoho Books"""
-        data = {
-            "customer_id": invoice_data.get("customer_id", ""),
-            "invoice_number": invoice_data.get("invoice_number", ""),
-            "date": invoice_data.get("date", datetime.now().strftime("%Y-%m-%d")),
-            "due_date": invoice_data.get("due_date", ""),
+        invoice = _coerce(InvoiceIn, invoice_data)
+        data = _BOOKS_INVOICE_BASE | {
+            "customer_id": invoice.customer_id,
+            "invoice_number": invoice.invoice_number,
+            "date": invoice.date if invoice.date is not None else datetime.now().strftime("%Y-%m-%d"),
+            "due_date": invoice.due_date,
             "line_items": [
                 {
-                    "name": invoice_data.get("subscription_name", "News Subscription"),
-                    "description": invoice_data.get("description", "Monthly news subscription"),
-                    "rate": invoice_data.get("amount", 0),
+                    "name": invoice.subscription_name,
+                    "description": invoice.description,
+                    "rate": invoice.amount,
                     "quantity": 1,
-                    "tax_id": invoice_data.get("tax_id", "")
+                    "tax_id": invoice.tax_id
                 }
-            ],
-            "payment_terms": 15,
-            "payment_terms_label": "Net 15"
+            ]
         }
         
         return self.make_api_request("books", "invoices", "POST", data)
     
-    def record_payment(self, payment_data: Dict) -> Dict:
+    def record_payment(self, payment_data: Union[PaymentIn, Dict]) -> Dict:
         """Record payment in Zoho Books"""
+        payment = _coerce(PaymentIn, payment_data)
         data = {
-            "customer_id": payment_data.get("customer_id", ""),
-            "payment_mode": payment_data.get("payment_method", "online"),
-            "amount": payment_data.get("amount", 0),
-            "date": payment_data.get("date", datetime.now().strftime("%Y-%m-%d")),
-            "reference_number": payment_data.get("reference_number", ""),
-            "description": payment_data.get("description", "Subscription payment"),
+            "customer_id": payment.customer_id,
+            "payment_mode": payment.payment_method,
+            "amount": payment.amount,
+            "date": payment.date if payment.date is not None else datetime.now().strftime("%Y-%m-%d"),
+            "reference_number": payment.reference_number,
+            "description": payment.description,
             "invoices": [
                 {
-                    "invoice_id": payment_data.get("invoice_id", ""),
-                    "amount_applied": payment_data.get("amount", 0)
+                    "invoice_id": payment.invoice_id,
+                    "amount_applied": payment.amount
                 }
             ]
         }
@@ -225,136 +667,119 @@ class ZohoIntegration:
     # Commerce Integration
     def create_product(self, product_data: Dict) -> Dict:
         """Create product in Zoho Commerce"""
-        data = {
-            "name": product_data.get("name", ""),
-            "description": product_data.get("description", ""),
-            "price": product_data.get("price", 0),
-            "category": product_data.get("category", ""),
-            "sku": product_data.get("sku", ""),
-            "stock_quantity": product_data.get("stock_quantity", 0),
-            "status": "active",
-            "digital_product": product_data.get("digital_product", True)
-        }
-        
-        return self.make_api_request("commerce", "products", "POST", data)
+        return self._build_and_send("product", product_data)
     
     def create_order(self, order_data: Dict) -> Dict:
         """Create order in Zoho Commerce"""
-        data = {
-            "customer_id": order_data.get("customer_id", ""),
-            "order_items": order_data.get("items", []),
-            "billing_address": order_data.get("billing_address", {}),
-            "shipping_address": order_data.get("shipping_address", {}),
-            "payment_method": order_data.get("payment_method", ""),
-            "order_status": "confirmed",
-            "total_amount": order_data.get("total_amount", 0)
-        }
-        
-        return self.make_api_request("commerce", "orders", "POST", data)
+        return self._build_and_send("order", order_data)
     
     # Inventory Integration
     def create_item(self, item_data: Dict) -> Dict:
         """Create item in Zoho Inventory"""
-        data = {
-            "name": item_data.get("name", ""),
-            "description": item_data.get("description", ""),
-            "rate": item_data.get("price", 0),
-            "sku": item_data.get("sku", ""),
-            "category_id": item_data.get("category_id", ""),
-            "item_type": "service",
-            "product_type": "service",
-            "is_taxable": True,
-            "status": "active"
-        }
-        
-        return self.make_api_request("inventory", "items", "POST", data)
+        return self._build_and_send("item", item_data)
     
     def update_item_stock(self, item_id: str, stock_data: Dict) -> Dict:
         """Update item stock in Zoho Inventory"""
-        data = {
-            "quantity_available": stock_data.get("quantity", 0),
-            "warehouse_id": stock_data.get("warehouse_id", "")
-        }
-        
-        return self.make_api_request("inventory", f"items/{item_id}/stock", "PUT", data)
+        return self._build_and_send("item_stock", stock_data, item_id)
     
     # Campaigns Integration
     def create_email_campaign(self, campaign_data: Dict) -> Dict:
         """Create email campaign in Zoho Campaigns"""
-        data = {
+        data = _CAMPAIGN_BASE | {
             "campaign_name": campaign_data.get("name", ""),
             "subject": campaign_data.get("subject", ""),
             "from_email": campaign_data.get("from_email", ""),
             "from_name": campaign_data.get("from_name", ""),
             "reply_to": campaign_data.get("reply_to", ""),
             "html_content": campaign_data.get("html_content", ""),
-            "mailing_list_ids": campaign_data.get("mailing_list_ids", []),
-            "campaign_type": "regular"
+            "mailing_list_ids": campaign_data.get("mailing_list_ids", [])
         }
         
+        # Campaign HTML can run to hundreds of KB, so stream it instead of building one body;
+        # anything other than a string (e.g. None) is encoded normally
+        if isinstance(data["html_content"], str):
+            data = JsonFieldStream(data, "html_content")
+        
         return self.make_api_request("campaigns", "campaigns", "POST", data)
     
     def add_contact_to_list(self, list_id: str, contact_data: Dict) -> Dict:
         """Add contact to mailing list"""
-        data = {
-            "contact_email": contact_data.get("email", ""),
-            "contact_name": contact_data.get("name", ""),
-            "first_name": contact_data.get("first_name", ""),
-            "last_name": contact_data.get("last_name", ""),
-            "phone": contact_data.get("phone", "")
-        }
-        
-        return self.make_api_request("campaigns", f"lists/{list_id}/contacts", "POST", data)
+        return self._build_and_send("list_contact", contact_data, list_id)
     
     # Analytics Integration
-    def get_crm_analytics(self, date_range: str = "last_30_days") -> Dict:
+    def get_crm_analytics(self, date_range: str = "last_30_days", refresh: bool = False) -> Dict:
         """Get CRM analytics"""
         params = {
             "date_range": date_range
         }
         
-        return self.make_api_request("crm", "analytics/leads", "GET", params=params)
+        return self._cached_analytics(
+            ("crm", date_range), refresh,
+            lambda: self.make_api_request("crm", "analytics/leads", "GET", params=params)
+        )
     
-    def get_books_analytics(self, date_range: str = "last_30_days") -> Dict:
+    def get_books_analytics(self, date_range: str = "last_30_days", refresh: bool = False) -> Dict:
         """Get Books analytics"""
         params = {
             "date_range": date_range
         }
         
-        return self.make_api_request("books", "reports/profit_and_loss", "GET", params=params)
+        return self._cached_analytics(
+            ("books", date_range), refresh,
+            lambda: self.make_api_request("books", "reports/profit_and_loss", "GET", params=params)
+        )
     
-    def sync_user_data(self, user_data: Dict) -> Dict:
-        """Sync user data across all Zoho services"""
-        results = {}
+    def _cached_analytics(self, key: tuple, refresh: bool, fetch) -> Dict:
+        """Return a fresh cached report for key, or fetch it and cache a successful result"""
+        now = time.monotonic()
         
-        # Create CRM contact
-        crm_contact = self.create_crm_contact(user_data)
-        results["crm_contact"] = crm_contact
+        # Callers get their own copy, so mutating a report cannot leak into the cache
+        if not refresh:
+            entry = self._analytics_cache.get(key)
+            if entry is not None and entry[0] > now:
+                return copy.deepcopy(entry[1])
         
-        # Create Books customer
-        books_customer = self.create_customer(user_data)
-        results["books_customer"] = books_customer
+        result = fetch()
         
-        # Add to campaigns mailing list
+        if "error" not in result:
+            # Drop expired reports first, and start over if the cache is still full
+            if len(self._analytics_cache) >= self._ANALYTICS_CACHE_SIZE:
+                self._analytics_cache = {k: v for k, v in self._analytics_cache.items() if v[0] > now}
+                if len(self._analytics_cache) >= self._ANALYTICS_CACHE_SIZE:
+                    self._analytics_cache = {}
+            self._analytics_cache[key] = (now + self._ANALYTICS_TTL, copy.deepcopy(result))
+        
+        return result
+    
+    def sync_user_data(self, user_data: Dict) -> Dict:
+        """Sync user data across all Zoho services"""
+        # The three services are independent, so their round trips overlap
+        crm_future = self._executor.submit(self.create_crm_contact, user_data)
+        books_future = self._executor.submit(self.create_customer, user_data)
+        campaign_future = None
         if user_data.get("email"):
-            campaign_contact = self.add_contact_to_list("default_list", user_data)
-            results["campaign_contact"] = campaign_contact
+            campaign_future = self._executor.submit(self.add_contact_to_list, "default_list", user_data)
+        
+        results = {
+            "crm_contact": crm_future.result(),
+            "books_customer": books_future.result()
+        }
+        
+        if campaign_future is not None:
+            results["campaign_contact"] = campaign_future.result()
         
         return results
     
+    def sync_many_users(self, users: List[Dict], max_concurrency: int = 20) -> List[Dict]:
+        """Sync many users across Zoho services, at most max_concurrency users at a time"""
+        # A dedicated pool, since each sync_user_data call fans out on the shared executor
+        with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="zoho-sync") as executor:
+            return list(executor.map(self.sync_user_data, users))
+    
     def process_subscription_purchase(self, subscription_data: Dict) -> Dict:
         """Process subscription purchase through Zoho ecosystem"""
         results = {}
         
-        # Create invoice in Books
-        invoice = self.create_subscription_invoice(subscription_data)
-        results["invoice"] = invoice
-        
-        # Record payment
-        if subscription_data.get("payment_confirmed"):
-            payment = self.record_payment(subscription_data)
-            results["payment"] = payment
-        
         # Create deal in CRM
         deal_data = {
             "deal_name": f"Subscription - {subscription_data.get('user_name', 'Unknown')}",
@@ -365,22 +790,44 @@ class ZohoIntegration:
             "type": "Subscription"
         }
         
-        deal = self.create_crm_deal(deal_data)
-        results["deal"] = deal
+        # Invoice and deal go out together; the payment waits for the invoice
+        invoice_future = self._executor.submit(self.create_subscription_invoice, subscription_data)
+        deal_future = self._executor.submit(self.create_crm_deal, deal_data)
+        
+        results["invoice"] = invoice_future.result()
+        
+        # Record payment
+        if subscription_data.get("payment_confirmed"):
+            results["payment"] = self.record_payment(subscription_data)
+        
+        results["deal"] = deal_future.result()
         
         return results
     
-    def get_comprehensive_analytics(self) -> Dict:
+    def get_comprehensive_analytics(self, date_range: str = "last_30_days", refresh: bool = False) -> Dict:
         """Get comprehensive analytics from all Zoho services"""
-        analytics = {}
+        return self._cached_analytics(
+            ("comprehensive", date_range), refresh,
+            lambda: self._combine_analytics(date_range, refresh)
+        )
+    
+    def _combine_analytics(self, date_range: str, refresh: bool) -> Dict:
+        """Fetch CRM and Books analytics and summarize them"""
+        # CRM and Books reports are independent, so fetch them side by side
+        crm_future = self._executor.submit(self.get_crm_analytics, date_range, refresh)
+        books_future = self._executor.submit(self.get_books_analytics, date_range, refresh)
+        crm_analytics = crm_future.result()
+        books_analytics = books_future.result()
         
-        # CRM analytics
-        crm_analytics = self.get_crm_analytics()
-        analytics["crm"] = crm_analytics
+        analytics = {
+            "crm": crm_analytics,
+            "books": books_analytics
+        }
         
-        # Books analytics
-        books_analytics = self.get_books_analytics()
-        analytics["books"] = books_analytics
+        # A summary of half the data would be misleading, so pass the error through
+        if "error" in crm_analytics or "error" in books_analytics:
+            analytics["error"] = crm_analytics.get("error") or books_analytics.get("error")
+            return analytics
         
         # Combine metrics
         analytics["summary"] = {
@@ -400,6 +847,10 @@ def sync_user_to_zoho(user_data: Dict) -> Dict:
     """Sync user data to Zoho"""
     return zoho.sync_user_data(user_data)
 
+def sync_users_to_zoho(users: List[Dict]) -> List[Dict]:
+    """Sync many users to Zoho"""
+    return zoho.sync_many_users(users)
+
 def process_subscription_in_zoho(subscription_data: Dict) -> Dict:
     """Process subscription through Zoho"""
     return zoho.process_subscription_purchase(subscription_data)